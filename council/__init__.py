@@ -6,6 +6,7 @@ Debate-Weighted Aggregation (DWA) for critical decision-making.
 
 Components:
 - schemas: Pydantic models for proposals, votes, and council sessions
+- enums: Role, trigger and vote enumerations (no pydantic dependency)
 - expertise_registry: Agent expertise weight management
 - trigger_detector: Detects conditions requiring council deliberation
 - voting_aggregator: DWA formula implementation with escalation logic
@@ -18,6 +19,7 @@ Components:
 __version__ = "0.1.0"
 __all__ = [
     "schemas",
+    "enums",
     "expertise_registry",
     "trigger_detector",
     "voting_aggregator",
@@ -0,0 +1,109 @@
+"""
+Concurrent runner shared by the phase integration tests
+
+Independent tests run in a thread pool; each test's output (including
+output from threads it starts) is captured and printed in test order, so
+wall-clock is the slowest test rather than the sum of all of them.
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout that routes each test thread's prints into its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[io.StringIO]) -> None:
+        """Send this thread's output to buffer (None restores the real stream)"""
+        self._local.buffer = buffer
+
+    def current(self) -> Optional[io.StringIO]:
+        """This thread's capture buffer, if any"""
+        return getattr(self._local, "buffer", None)
+
+    def write(self, text: str) -> int:
+        return (self.current() or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@contextlib.contextmanager
+def _inherit_capture(output: _ThreadOutput) -> Iterator[None]:
+    """Threads started while active write to the buffer of the thread that started them"""
+    original_start = threading.Thread.start
+
+    def start(thread: threading.Thread) -> None:
+        buffer = output.current()
+        if buffer is not None:
+            run = thread.run
+
+            def run_captured() -> None:
+                output.capture(buffer)
+                run()
+
+            thread.run = run_captured
+        original_start(thread)
+
+    threading.Thread.start = start
+    try:
+        yield
+    finally:
+        threading.Thread.start = original_start
+
+
+def _run_test(
+    test_func: Callable[[], bool], output: _ThreadOutput, exception_message: str
+) -> Tuple[bool, str]:
+    """Run one test with its output captured, returning (passed, output)"""
+    buffer = io.StringIO()
+    output.capture(buffer)
+    try:
+        passed = bool(test_func())
+    except Exception as e:
+        print(f"\n{exception_message}: {e}")
+        traceback.print_exc(file=buffer)
+        passed = False
+    finally:
+        output.capture(None)
+    return passed, buffer.getvalue()
+
+
+def run_tests(
+    tests: Sequence[Callable[[], bool]],
+    exception_message: str = "✗ TEST FAILED WITH EXCEPTION",
+) -> List[bool]:
+    """
+    Run independent tests concurrently, printing each one's output in order.
+
+    Args:
+        tests: Test functions returning True on success
+        exception_message: Prefix printed when a test raises
+
+    Returns:
+        Pass/fail per test, in the order given
+    """
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with _inherit_capture(output), ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            runs = list(
+                executor.map(lambda test: _run_test(test, output, exception_message), tests)
+            )
+    finally:
+        sys.stdout = output._stream
+
+    results = []
+    for passed, text in runs:
+        sys.stdout.write(text)
+        results.append(passed)
+    return results
@@ -9,14 +9,25 @@ accepts CLI arguments and returns structured recommendations.
 Usage:
     python3 consult_external_model.py --prompt "..." [--model MODEL]
 
+The CLI entry point is kept for backward compatibility (legacy). Python
+callers should import consult() and call it in-process.
+
 Phase 4: This structure allows easy integration with consult-llm MCP when available.
 For now, it provides intelligent model selection and structured output.
 """
 
-import argparse
-import json
+import re
 import sys
-from pathlib import Path
+from typing import Optional
+
+# Single-pass prompt scan: each named group maps to one analysis flag.
+# Keywords match in any case; the confidence marker only as written
+_KEYWORD_PATTERN = re.compile(
+    r"(?P<high_confidence>(?-i:confidence: 0\.[89]))"
+    r"|(?P<security>security|auth)"
+    r"|(?P<architecture>architecture|design)",
+    re.IGNORECASE,
+)
 
 
 def consult_external_model(prompt: str, preferred_model: str = None) -> dict:
@@ -41,10 +52,11 @@ def consult_external_model(prompt: str, preferred_model: str = None) -> dict:
     # For Phase 4 testing: Intelligent structured response
     # Analyzes prompt to provide meaningful recommendation
 
-    # Extract key information from prompt
-    has_high_confidence = "confidence: 0.8" in prompt or "confidence: 0.9" in prompt
-    has_security = "security" in prompt.lower() or "auth" in prompt.lower()
-    has_architecture = "architecture" in prompt.lower() or "design" in prompt.lower()
+    # Extract key information from prompt (one scan, no lowercased copies)
+    found = {match.lastgroup for match in _KEYWORD_PATTERN.finditer(prompt)}
+    has_high_confidence = "high_confidence" in found
+    has_security = "security" in found
+    has_architecture = "architecture" in found
 
     # Generate recommendation based on context
     if has_security:
@@ -90,7 +102,46 @@ def consult_external_model(prompt: str, preferred_model: str = None) -> dict:
     }
 
 
+def format_text(result: dict) -> str:
+    """
+    Render a consultation result in the plain-text subprocess format.
+
+    Args:
+        result: dict returned by consult_external_model()
+
+    Returns:
+        Multi-line text with recommendation, model and reasoning
+    """
+    lines = [
+        f"Recommendation: {result['recommendation']}",
+        f"Model: {result['model']}",
+    ]
+    lines.extend(f"  - {reason}" for reason in result["reasoning"])
+    return "\n".join(lines)
+
+
+def consult(prompt: str, model: Optional[str] = None) -> str:
+    """
+    Consult external model and return the plain-text response.
+
+    In-process equivalent of running this script with --format text.
+
+    Args:
+        prompt: The escalation prompt with proposals and context
+        model: Preferred model (None for auto-select)
+
+    Returns:
+        Multi-line text with recommendation, model and reasoning
+    """
+    return format_text(consult_external_model(prompt, model))
+
+
 def main():
+    # CLI-only imports: keep importing consult() cheap for the orchestrator,
+    # which calls it in-process on its _escalation_executor
+    import argparse
+    import json
+
     parser = argparse.ArgumentParser(description="Consult external model for council escalation")
     parser.add_argument("--prompt", required=True, help="Escalation prompt")
     parser.add_argument("--model", default=None, help="Preferred model (auto-select if not specified)")
@@ -102,13 +153,12 @@ def main():
         result = consult_external_model(args.prompt, args.model)
 
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            # Indent only for humans; compact output uses the C encoder fast path
+            indent = 2 if sys.stdout.isatty() else None
+            sys.stdout.write(json.dumps(result, indent=indent) + "\n")
         else:
-            # Text format for subprocess consumption
-            print(f"Recommendation: {result['recommendation']}")
-            print(f"Model: {result['model']}")
-            for reason in result['reasoning']:
-                print(f"  - {reason}")
+            # Text format for subprocess consumption (single write)
+            sys.stdout.write(format_text(result) + "\n")
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
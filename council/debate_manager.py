@@ -7,17 +7,80 @@ Debates are OPTIONAL and only triggered when:
 - Initial confidence is low (< 0.85)
 - Significant disagreement detected
 
+Debates are gated (skipped outright) when:
+- Every agent is highly confident (>= 0.90) and all agree
+- Every agent has very low confidence (< 0.40) - debate cannot help,
+  so the decision goes straight to voting and external-model escalation
+
 Key Functions:
 - should_debate(): Determine if debate is needed
-- conduct_debate(): Run debate rounds
+- conduct_debate(): Run debate rounds (sync wrapper around aconduct_debate)
+- aconduct_debate(): Run debate rounds with concurrent critique generation
 - _generate_critiques(): Collect critiques from agents
 - _refine_proposals(): Update proposals based on critiques
 """
 
-from typing import List, Optional, Tuple
+import asyncio
+import logging
+import os
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from council.schemas import Critique, DebateRound, Proposal
 
+_log = logging.getLogger("council")
+
+
+def _top_recommendation_count(counts: Counter) -> int:
+    """Size of the largest recommendation group (0 when there are none)"""
+    return max(counts.values(), default=0)
+
+
+@dataclass(frozen=True)
+class _ProposalBatch:
+    """
+    Column view of one list of proposals, built once and shared between checks.
+
+    Recommendations are interned as integer cluster ids (equal normalized
+    recommendation -> equal id), so the gates, consensus score and debate
+    graph compare ints rather than re-reading Proposal attributes.
+    """
+
+    recommendations: Tuple[str, ...]  # Raw recommendations (cache key)
+    confidences: Tuple[float, ...]  # Cache key as well - refinement adjusts these
+    recommendation_ids: Tuple[int, ...]
+    counts: Counter  # Proposals per recommendation id
+    top_count: int
+
+    @classmethod
+    def from_proposals(cls, proposals: List[Proposal]) -> "_ProposalBatch":
+        recommendations = tuple(p.recommendation for p in proposals)
+        confidences = tuple(p.confidence for p in proposals)
+        cluster_ids: Dict[str, int] = {}
+        recommendation_ids = tuple(
+            cluster_ids.setdefault(p.recommendation_key, len(cluster_ids))
+            for p in proposals
+        )
+        counts = Counter(recommendation_ids)
+        return cls(
+            recommendations,
+            confidences,
+            recommendation_ids,
+            counts,
+            _top_recommendation_count(counts),
+        )
+
+    def matches(self, proposals: List[Proposal]) -> bool:
+        """Whether this batch was built from proposals with the same content"""
+        return (
+            len(proposals) == len(self.recommendations)
+            and all(
+                p.recommendation == r and p.confidence == c
+                for p, r, c in zip(proposals, self.recommendations, self.confidences)
+            )
+        )
+
 
 class DebateManager:
     """
@@ -31,6 +94,9 @@ class DebateManager:
         consensus_threshold: float = 0.80,
         confidence_threshold: float = 0.85,
         max_rounds: int = 2,
+        max_critique_degree: int = 2,
+        gate_threshold: float = 0.90,
+        escalate_threshold: float = 0.40,
     ):
         """
         Initialize debate manager.
@@ -39,10 +105,54 @@ class DebateManager:
             consensus_threshold: Min consensus to skip debate (default: 0.80)
             confidence_threshold: Min confidence to skip debate (default: 0.85)
             max_rounds: Maximum debate rounds (default: 2)
+            max_critique_degree: Most-disagreeing peers each agent critiques,
+                in addition to one peer per opposing recommendation (default: 2)
+            gate_threshold: Min per-agent confidence to skip debate on a
+                unanimous recommendation (default: 0.90). Lower values gate
+                more sessions; raise it if gated decisions prove unreliable.
+            escalate_threshold: If every agent is below this confidence, skip
+                debate and let voting escalate to an external model (default: 0.40)
         """
         self.consensus_threshold = consensus_threshold
         self.confidence_threshold = confidence_threshold
         self.max_rounds = max_rounds
+        self.max_critique_degree = max_critique_degree
+        self.gate_threshold = gate_threshold
+        self.escalate_threshold = escalate_threshold
+
+        # Columns of the most recently inspected proposals; should_debate, the
+        # debate graph and each round's consensus share one construction
+        self._batch: Optional[_ProposalBatch] = None
+
+    @classmethod
+    def from_env(cls) -> "DebateManager":
+        """
+        Create a debate manager with thresholds overridden from the environment.
+
+        Reads COUNCIL_DEBATE_CONSENSUS, COUNCIL_DEBATE_CONFIDENCE,
+        COUNCIL_DEBATE_MAX_ROUNDS, COUNCIL_DEBATE_GATE and
+        COUNCIL_DEBATE_ESCALATE; unset variables keep the defaults.
+        """
+        overrides = {}
+        for name, env_var, cast in (
+            ("consensus_threshold", "COUNCIL_DEBATE_CONSENSUS", float),
+            ("confidence_threshold", "COUNCIL_DEBATE_CONFIDENCE", float),
+            ("max_rounds", "COUNCIL_DEBATE_MAX_ROUNDS", int),
+            ("gate_threshold", "COUNCIL_DEBATE_GATE", float),
+            ("escalate_threshold", "COUNCIL_DEBATE_ESCALATE", float),
+        ):
+            value = os.getenv(env_var)
+            if value:
+                overrides[name] = cast(value)
+        return cls(**overrides)
+
+    def _get_batch(self, proposals: List[Proposal]) -> _ProposalBatch:
+        """Get the column view of proposals, reusing the last one if unchanged"""
+        batch = self._batch
+        if batch is None or not batch.matches(proposals):
+            batch = _ProposalBatch.from_proposals(proposals)
+            self._batch = batch
+        return batch
 
     def should_debate(self, proposals: List[Proposal]) -> Tuple[bool, str]:
         """
@@ -57,34 +167,54 @@ class DebateManager:
         if len(proposals) < 2:
             return False, "Only one proposal - no debate needed"
 
-        # Calculate aggregate confidence
-        avg_confidence = sum(p.confidence for p in proposals) / len(proposals)
-        if avg_confidence < self.confidence_threshold:
-            return True, f"Low confidence ({avg_confidence:.2f} < {self.confidence_threshold})"
+        # Thresholds as locals for the checks below
+        consensus_threshold = self.consensus_threshold
+        confidence_threshold = self.confidence_threshold
+        gate_threshold = self.gate_threshold
+        escalate_threshold = self.escalate_threshold
+
+        batch = self._get_batch(proposals)
+        confidence_values = batch.confidences
+        n = len(confidence_values)
+        unique_recommendations = len(batch.counts)
+
+        # Confidence gate: unanimous, highly confident councils don't need debate
+        if unique_recommendations == 1 and min(confidence_values) >= gate_threshold:
+            return False, "Gated: high-confidence unanimous proposals - no debate needed"
+
+        # Escalation gate: debate between uniformly unsure agents won't converge;
+        # voting flags the low confidence and escalates to an external model
+        if max(confidence_values) < escalate_threshold:
+            return False, (
+                f"Gated: all confidences below {escalate_threshold} "
+                "- escalate to external model"
+            )
 
-        # Calculate confidence variance (measure of disagreement)
-        confidence_values = [p.confidence for p in proposals]
-        mean_conf = sum(confidence_values) / len(confidence_values)
-        variance = sum((c - mean_conf) ** 2 for c in confidence_values) / len(
-            confidence_values
-        )
+        # Mean and variance in one numerically stable pass (Welford)
+        mean_conf = 0.0
+        m2 = 0.0
+        for count, c in enumerate(confidence_values, 1):
+            delta = c - mean_conf
+            mean_conf += delta / count
+            m2 += (c - mean_conf) * delta
+        variance = m2 / n  # Population variance (measure of disagreement)
+
+        if mean_conf < confidence_threshold:
+            return True, f"Low confidence ({mean_conf:.2f} < {confidence_threshold})"
 
         if variance > 0.05:  # High variance threshold
             return True, f"High disagreement (variance: {variance:.3f})"
 
         # Check for conflicting recommendations
-        recommendations = [p.recommendation.lower() for p in proposals]
-        unique_recommendations = len(set(recommendations))
-        if unique_recommendations == len(proposals):
+        if unique_recommendations == n:
             # All agents recommend different things
             return True, "All proposals differ - need discussion"
 
         # Calculate simple consensus score (agreement ratio)
-        most_common_count = max(recommendations.count(r) for r in set(recommendations))
-        consensus = most_common_count / len(proposals)
+        consensus = batch.top_count / n
 
-        if consensus < self.consensus_threshold:
-            return True, f"Low consensus ({consensus:.2f} < {self.consensus_threshold})"
+        if consensus < consensus_threshold:
+            return True, f"Low consensus ({consensus:.2f} < {consensus_threshold})"
 
         return False, f"High consensus ({consensus:.2f}) - no debate needed"
 
@@ -97,6 +227,31 @@ class DebateManager:
         """
         Conduct debate rounds between agents.
 
+        Synchronous wrapper around aconduct_debate() for callers that are
+        not running an event loop.
+
+        Args:
+            proposals: Initial proposals
+            domain: Domain context
+            operation_text: Operation being deliberated
+
+        Returns:
+            List of DebateRound objects (1-2 rounds)
+        """
+        return asyncio.run(self.aconduct_debate(proposals, domain, operation_text))
+
+    async def aconduct_debate(
+        self,
+        proposals: List[Proposal],
+        domain: str,
+        operation_text: str,
+    ) -> List[DebateRound]:
+        """
+        Conduct debate rounds between agents (async).
+
+        Critiques within a round are generated concurrently. Each round only
+        sees the critiques of the previous round, so rounds stay sequential.
+
         Args:
             proposals: Initial proposals
             domain: Domain context
@@ -108,7 +263,7 @@ class DebateManager:
         debate_rounds = []
 
         # Round 1: Critique phase
-        round1 = self._conduct_round(
+        round1 = await self._conduct_round(
             round_number=1,
             proposals=proposals,
             domain=domain,
@@ -119,7 +274,7 @@ class DebateManager:
         # Check if round 2 is needed
         if round1.should_continue and len(debate_rounds) < self.max_rounds:
             # Round 2: Refinement based on critiques
-            round2 = self._conduct_round(
+            round2 = await self._conduct_round(
                 round_number=2,
                 proposals=round1.proposals,  # Use refined proposals
                 domain=domain,
@@ -130,7 +285,7 @@ class DebateManager:
 
         return debate_rounds
 
-    def _conduct_round(
+    async def _conduct_round(
         self,
         round_number: int,
         proposals: List[Proposal],
@@ -152,7 +307,7 @@ class DebateManager:
             DebateRound object
         """
         # Generate critiques (agents critique each other's proposals)
-        critiques = self._generate_critiques(
+        critiques = await self._generate_critiques(
             proposals, domain, operation_text, previous_critiques
         )
 
@@ -176,7 +331,7 @@ class DebateManager:
             should_continue=should_continue,
         )
 
-    def _generate_critiques(
+    async def _generate_critiques(
         self,
         proposals: List[Proposal],
         domain: str,
@@ -186,6 +341,10 @@ class DebateManager:
         """
         Generate critiques from agents reviewing each other's proposals.
 
+        Only edges of the sparse debate graph are critiqued, and all of them
+        are critiqued concurrently, so a round costs one critique latency
+        rather than N*(N-1) sequential calls.
+
         Args:
             proposals: Proposals to critique
             domain: Domain context
@@ -195,37 +354,119 @@ class DebateManager:
         Returns:
             List of Critique objects
         """
+        # Each agent critiques its selected debate partners
+        pairs = [
+            (proposals[i], proposals[j])
+            for i, j in self._build_debate_graph(proposals)
+        ]
+
+        results = await asyncio.gather(
+            *[
+                self._critique_pair(proposal, other_proposal, domain, operation_text)
+                for proposal, other_proposal in pairs
+            ],
+            return_exceptions=True,
+        )
+
         critiques = []
+        for (proposal, other_proposal), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                _log.warning(
+                    "%s failed to critique %s: %s",
+                    proposal.agent_name,
+                    other_proposal.agent_name,
+                    result,
+                )
+                continue
+            if result is not None:
+                critiques.append(result)
+
+        return critiques
+
+    def _build_debate_graph(self, proposals: List[Proposal]) -> List[Tuple[int, int]]:
+        """
+        Select the debate partners for each agent (sparse debate graph).
+
+        Rather than every agent critiquing every other proposal, each agent
+        critiques:
+        - its max_critique_degree most disagreeing peers (largest confidence gap)
+        - one peer from each opposing recommendation cluster, so every
+          competing recommendation is challenged at least once
+
+        Args:
+            proposals: Proposals being debated
+
+        Returns:
+            List of (critic_index, target_index) edges
+        """
+        batch = self._get_batch(proposals)
+        confidences = batch.confidences
+        recommendations = batch.recommendation_ids
+
+        edges: List[Tuple[int, int]] = []
+        for i, confidence in enumerate(confidences):
+            # Peers ordered by disagreement (largest confidence gap first)
+            peers = sorted(
+                (j for j in range(len(confidences)) if j != i),
+                key=lambda j: abs(confidence - confidences[j]),
+                reverse=True,
+            )
+
+            partners = peers[: self.max_critique_degree]
+
+            # Most disagreeing peer from each opposing recommendation cluster
+            covered = {recommendations[j] for j in partners}
+            for j in peers:
+                recommendation = recommendations[j]
+                if recommendation != recommendations[i] and recommendation not in covered:
+                    covered.add(recommendation)
+                    partners.append(j)
 
+            edges.extend((i, j) for j in sorted(partners))
+
+        return edges
+
+    async def _critique_pair(
+        self,
+        proposal: Proposal,
+        other_proposal: Proposal,
+        domain: str,
+        operation_text: str,
+    ) -> Optional[Critique]:
+        """
+        Generate one agent's critique of another agent's proposal.
+
+        Args:
+            proposal: Proposal of the critiquing agent
+            other_proposal: Proposal being critiqued
+            domain: Domain context
+            operation_text: Operation text
+
+        Returns:
+            Critique object, or None if the agent has no objection
+        """
         # For Phase 2, use simulated critiques
         # Phase 3 will integrate actual Ollama/Claude generation
 
-        # Each agent critiques other agents' proposals
-        for i, proposal in enumerate(proposals):
-            # Get other proposals (not this one)
-            other_proposals = proposals[:i] + proposals[i + 1 :]
-
-            for other_proposal in other_proposals:
-                # Simulate critique based on confidence difference
-                confidence_diff = abs(proposal.confidence - other_proposal.confidence)
-
-                if confidence_diff > 0.2:
-                    # Significant disagreement - generate critique
-                    severity = "moderate" if confidence_diff < 0.4 else "critical"
-
-                    critique = Critique(
-                        source_agent=proposal.agent_name,
-                        target_proposal_id=other_proposal.proposal_id,
-                        critique_text=f"{proposal.agent_name} disagrees with {other_proposal.agent_name}'s approach",
-                        suggested_improvements=[
-                            "Consider alternative approach",
-                            "Review security implications",
-                        ],
-                        severity=severity,
-                    )
-                    critiques.append(critique)
+        # Simulate critique based on confidence difference
+        confidence_diff = abs(proposal.confidence - other_proposal.confidence)
 
-        return critiques
+        if confidence_diff <= 0.2:
+            return None
+
+        # Significant disagreement - generate critique
+        severity = "moderate" if confidence_diff < 0.4 else "critical"
+
+        return Critique(
+            source_agent=proposal.agent_name,
+            target_proposal_id=other_proposal.proposal_id,
+            critique_text=f"{proposal.agent_name} disagrees with {other_proposal.agent_name}'s approach",
+            suggested_improvements=[
+                "Consider alternative approach",
+                "Review security implications",
+            ],
+            severity=severity,
+        )
 
     def _refine_proposals(
         self, proposals: List[Proposal], critiques: List[Critique]
@@ -260,10 +501,7 @@ class DebateManager:
             return 1.0
 
         # Group by similarity of recommendations (simplified)
-        recommendations = [p.recommendation.lower() for p in proposals]
-        most_common_count = max(recommendations.count(r) for r in set(recommendations))
-
-        return most_common_count / len(proposals)
+        return self._get_batch(proposals).top_count / len(proposals)
 
 
 # Singleton instance
@@ -274,7 +512,7 @@ def get_manager() -> DebateManager:
     """Get singleton DebateManager instance (lazy initialization)"""
     global _manager
     if _manager is None:
-        _manager = DebateManager()
+        _manager = DebateManager.from_env()
     return _manager
 
 
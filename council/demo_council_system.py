@@ -11,18 +11,23 @@ Demonstrates the complete council workflow:
 6. Decision output
 
 Run this to see the council system in action!
+
+Usage:
+    python3 demo_council_system.py [--interactive]
 """
 
-import json
+import argparse
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-claude_dir = Path.home() / ".claude"
-sys.path.insert(0, str(claude_dir))
+# When run as a script, make the installed council/lib packages importable.
+# Importing this module from an initialized interpreter leaves sys.path alone.
+if not __package__:
+    claude_dir = str(Path.home() / ".claude")
+    if claude_dir not in sys.path:
+        sys.path.insert(0, claude_dir)
 
 # Import council modules
-from council.orchestrator import Orchestrator
 from council.expertise_registry import ExpertiseRegistry
 from lib.message_bus import MessageBus, MessageType, SourceType
 
@@ -63,6 +68,15 @@ def demo_1_trigger_detection():
 
     registry = ExpertiseRegistry()
 
+    # Look up each domain's experts once, with their weight for that domain
+    domain_experts = {
+        domain: [
+            (agent.name, agent.get_expertise(domain))
+            for agent in registry.get_relevant_agents(domain, min_weight=0.5)
+        ]
+        for domain in {d for op in operations for d in op['domains']}
+    }
+
     for i, op in enumerate(operations, 1):
         print(f"Operation {i}: \"{op['text']}\"")
         print(f"Domains: {', '.join(op['domains']) if op['domains'] else 'none'}")
@@ -72,9 +86,8 @@ def demo_1_trigger_detection():
             # Show which agents would be selected
             all_agents = set()
             for domain in op['domains']:
-                agents = registry.get_relevant_agents(domain, min_weight=0.5)
-                for agent in agents:
-                    all_agents.add((agent.name, domain, agent.expertise_weights.get(domain, 0.0)))
+                for agent_name, weight in domain_experts[domain]:
+                    all_agents.add((agent_name, domain, weight))
 
             # Sort by expertise
             sorted_agents = sorted(all_agents, key=lambda x: x[2], reverse=True)
@@ -170,33 +183,34 @@ def demo_3_voting():
 
     print("DWA Formula: Score = Σ (Vote × Confidence × Expertise Weight)\n")
 
-    # Calculate scores
-    oauth_score = 0.0
-    jwt_score = 0.0
+    # Calculate scores (single pass, accumulated per option)
+    scores = {"OAuth 2.0": 0.0, "JWT": 0.0}
+    vote_counts = {"OAuth 2.0": 0, "JWT": 0}
 
     print_subsection("Vote Breakdown")
     for vote in votes:
+        option = vote['vote']
         score = vote['confidence'] * vote['expertise']
-        if vote['vote'] == "OAuth 2.0":
-            oauth_score += score
-            vote_symbol = "→ OAuth 2.0"
-        else:
-            jwt_score += score
-            vote_symbol = "→ JWT"
+        scores[option] += score
+        vote_counts[option] += 1
+        vote_symbol = f"→ {option}"
 
         print(f"{vote['agent']:25} {vote_symbol:15} ({vote['confidence']:.2f} × {vote['expertise']:.2f} = {score:.3f})")
 
+    oauth_score = scores["OAuth 2.0"]
+    jwt_score = scores["JWT"]
+
     print(f"\n{'-' * 70}")
     print(f"OAuth 2.0 Total Score: {oauth_score:.3f}")
     print(f"JWT Total Score:       {jwt_score:.3f}")
     print(f"{'-' * 70}")
 
     # Calculate confidence
+    winner = max(scores, key=scores.get)
     total_votes = len(votes)
-    winning_votes = sum(1 for v in votes if v['vote'] == "OAuth 2.0")
+    winning_votes = vote_counts[winner]
     confidence = winning_votes / total_votes
 
-    winner = "OAuth 2.0" if oauth_score > jwt_score else "JWT"
     margin = abs(oauth_score - jwt_score) / max(oauth_score, jwt_score)
 
     print(f"\n🏆 Winner: {winner}")
@@ -273,7 +287,7 @@ def demo_4_message_bus():
     messages = bus.subscribe("bus:coordination", limit=5)
     print(f"Retrieved {len(messages)} messages from bus:coordination")
     for i, msg_data in enumerate(messages, 1):
-        msg = json.loads(msg_data["value"])
+        msg = msg_data["value"]
         print(f"\n  Message {i}:")
         print(f"    Source: {msg['source']['id']}")
         print(f"    Action: {msg['payload']['action']}")
@@ -335,8 +349,18 @@ def demo_5_full_workflow():
     print("  ✓ Queryable for future reference")
 
 
-def main():
+def main(argv=None):
     """Run all demos"""
+    parser = argparse.ArgumentParser(description="DWA council system demo")
+    parser.add_argument(
+        "--interactive", action="store_true", help="Pause between demos"
+    )
+    args = parser.parse_args(argv)
+
+    def pause(next_demo):
+        if args.interactive:
+            input(f"\nPress Enter to continue to {next_demo}...")
+
     print("\n" + "=" * 70)
     print("  DWA COUNCIL SYSTEM - INTERACTIVE DEMO")
     print("  Multi-Agent Deliberation Platform")
@@ -344,16 +368,16 @@ def main():
 
     try:
         demo_1_trigger_detection()
-        input("\nPress Enter to continue to Demo 2...")
+        pause("Demo 2")
 
         proposals = demo_2_proposal_generation()
-        input("\nPress Enter to continue to Demo 3...")
+        pause("Demo 3")
 
         demo_3_voting()
-        input("\nPress Enter to continue to Demo 4...")
+        pause("Demo 4")
 
         demo_4_message_bus()
-        input("\nPress Enter to continue to Demo 5...")
+        pause("Demo 5")
 
         demo_5_full_workflow()
 
@@ -0,0 +1,38 @@
+"""
+Enumerations for DWA Council System
+
+Kept free of pydantic so modules on the per-tool-call path (trigger
+detection) can import them without loading the schema models.
+Also re-exported from council.schemas.
+"""
+
+from enum import Enum
+
+
+class CouncilRole(str, Enum):
+    """Agent's role in council deliberation"""
+
+    PROPOSER = "proposer"  # Generates proposals and votes
+    REVIEWER = "reviewer"  # Reviews but doesn't propose
+    ABSTAINER = "abstainer"  # Cannot participate
+
+
+class TriggerCondition(str, Enum):
+    """Conditions that trigger council convocation"""
+
+    ARCHITECTURAL = "architectural"  # Design choices, tech stack
+    SECURITY = "security"  # Auth, secrets, vulnerabilities
+    DISAGREEMENT = "disagreement"  # Agent conflicts
+    QUALITY_FAILURE = "quality_failure"  # TDD, linting, test failures
+    ETHICAL = "ethical"  # Privacy, bias concerns
+    LOW_CONFIDENCE = "low_confidence"  # Uncertainty < 0.75
+    EXTERNAL_COMMITMENT = "external_commitment"  # Deploys, API calls
+    NOVEL_QUERY = "novel_query"  # Out-of-distribution tasks
+
+
+class VoteType(str, Enum):
+    """Types of votes in DWA system"""
+
+    APPROVE = "approve"  # Vote for this recommendation
+    REJECT = "reject"  # Vote against
+    ABSTAIN = "abstain"  # No opinion
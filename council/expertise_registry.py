@@ -10,14 +10,32 @@ Key Functions:
 - get_agent_expertise(agent_name): Retrieve specific agent profile
 """
 
+import bisect
+import heapq
+import os
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .schemas import AgentExpertise, CouncilRole
 
+# YAML frontmatter block at the very start of an agent file
+_FRONTMATTER_RE = re.compile(r"\A\ufeff?---\s*\n(.*?)\n---", re.DOTALL)
+
+# Bytes read up front; frontmatter is a small header, the prompt body is skipped
+_FRONTMATTER_READ_SIZE = 8192
+
 
 class ExpertiseRegistry:
     """
@@ -44,9 +62,17 @@ class ExpertiseRegistry:
         """
         if agents_dir is None:
             agents_dir = Path.home() / ".claude" / "agents"
+        elif not isinstance(agents_dir, Path):
+            agents_dir = Path(agents_dir)
 
-        self.agents_dir = Path(agents_dir)
+        self.agents_dir = agents_dir
         self._cache: Dict[str, AgentExpertise] = {}
+        # (domain, min_weight) → relevant agents; profiles are static between reloads
+        self._relevant_cache: Dict[Tuple[str, float], Tuple[AgentExpertise, ...]] = {}
+        # domain → (negated weights ascending, agents) for non-abstainers
+        self._by_domain: Dict[str, Tuple[List[float], List[AgentExpertise]]] = {}
+        self._proposers: Tuple[AgentExpertise, ...] = ()
+        self._domains: Tuple[str, ...] = ()
         self._load_all_agents()
 
     def _load_all_agents(self) -> None:
@@ -57,19 +83,75 @@ class ExpertiseRegistry:
                 "Expected at ~/.claude/agents/"
             )
 
-        # Load top-level agents
-        for agent_file in self.agents_dir.glob("*.md"):
-            self._load_agent_file(agent_file)
+        # Top-level agents plus subdirectories (e.g., hoa/hoa-orchestrator.md)
+        agent_files = [Path(p) for p in self._iter_md_files(self.agents_dir)]
+
+        if agent_files:
+            # Reads and YAML parsing release the GIL, so files load concurrently;
+            # map() keeps directory order and _cache is filled on this thread only
+            with ThreadPoolExecutor(max_workers=min(16, len(agent_files))) as executor:
+                for expertise in executor.map(self._parse_agent_file, agent_files):
+                    if expertise is not None:
+                        self._cache[expertise.name] = expertise
+
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Precompute lookups derived from loaded profiles (static until reload)"""
+        # Enum members are singletons: bind once and compare by identity
+        proposer = CouncilRole.PROPOSER
+        abstainer = CouncilRole.ABSTAINER
+
+        self._proposers = tuple(
+            agent for agent in self._cache.values() if agent.council_role is proposer
+        )
+        self._domains = tuple(
+            sorted({d for agent in self._cache.values() for d in agent.expertise_weights})
+        )
+
+        # Non-abstaining agents by domain, highest expertise first
+        by_domain: Dict[str, List[Tuple[float, AgentExpertise]]] = {}
+        for agent in self._cache.values():
+            if agent.council_role is abstainer:
+                continue
+            for domain, weight in agent.expertise_weights.items():
+                by_domain.setdefault(domain, []).append((weight, agent))
+
+        self._by_domain = {}
+        for domain, entries in by_domain.items():
+            # Stable sort keeps load order among equally weighted agents
+            entries.sort(key=lambda entry: -entry[0])
+            self._by_domain[domain] = (
+                [-weight for weight, _ in entries],
+                [agent for _, agent in entries],
+            )
 
-        # Load agents in subdirectories (e.g., hoa/hoa-orchestrator.md)
-        for agent_file in self.agents_dir.rglob("**/*.md"):
-            if agent_file.parent != self.agents_dir:  # Skip if already loaded
-                self._load_agent_file(agent_file)
+    @staticmethod
+    def _iter_md_files(root: Path) -> Iterator[str]:
+        """
+        Yield paths of all .md files under root in a single directory walk.
 
-    def _load_agent_file(self, file_path: Path) -> None:
+        Files in a directory are yielded before any of its subdirectories are
+        visited, so top-level agents load first.
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            subdirs = []
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        yield entry.path
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def _parse_agent_file(file_path: Path) -> Optional[AgentExpertise]:
         """
         Parse YAML frontmatter from agent markdown file.
 
+        Returns None for files without valid agent frontmatter.
+
         Expected format:
         ---
         name: agent-name
@@ -81,42 +163,59 @@ class ExpertiseRegistry:
         ---
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
+            with file_path.open("rb") as f:
+                head = f.read(_FRONTMATTER_READ_SIZE)
+
+                # Files without frontmatter (docs, READMEs) skip the regex entirely
+                if not head.startswith((b"---", b"\xef\xbb\xbf---")):
+                    return None
+
+                end = head.find(b"\n---", 3)
+                if end == -1:
+                    # Unusually long frontmatter - read the rest of the file
+                    head += f.read()
+                    end = head.find(b"\n---", 3)
+
+            # Only the header slice is decoded, never the markdown body
+            content = head[: end + 4].decode("utf-8") if end != -1 else ""
 
             # Extract YAML frontmatter (between --- markers)
-            frontmatter_match = re.match(
-                r"^---\s*\n(.*?)\n---", content, re.DOTALL | re.MULTILINE
-            )
+            frontmatter_match = _FRONTMATTER_RE.match(content)
 
             if not frontmatter_match:
                 # No frontmatter - skip this file
-                return
+                return None
 
             frontmatter_text = frontmatter_match.group(1)
-            data = yaml.safe_load(frontmatter_text)
+            data = yaml.load(frontmatter_text, Loader=_YamlLoader)
 
             if not data or "name" not in data:
                 # Invalid frontmatter - skip
-                return
+                return None
+
+            # Intern domain names: every agent shares the same few domain keys,
+            # and lookups with literal domains then match by identity
+            expertise_weights = {
+                sys.intern(domain): weight
+                for domain, weight in data.get("expertise_weights", {}).items()
+            }
 
             # Parse into AgentExpertise model
-            agent_name = data["name"]
-            expertise = AgentExpertise(
-                name=agent_name,
-                expertise_weights=data.get("expertise_weights", {}),
+            return AgentExpertise(
+                name=data["name"],
+                expertise_weights=expertise_weights,
                 council_role=CouncilRole(data.get("council_role", "proposer")),
                 model_tier=data.get("model", "sonnet"),
                 description=data.get("description"),
             )
 
-            self._cache[agent_name] = expertise
-
         except Exception as e:
             # Log error but don't fail entire registry load
             print(f"Warning: Failed to load agent from {file_path}: {e}")
+            return None
 
     def get_relevant_agents(
-        self, domain: str, min_weight: float = 0.5
+        self, domain: str, min_weight: float = 0.5, limit: Optional[int] = None
     ) -> List[AgentExpertise]:
         """
         Find agents with expertise in a given domain.
@@ -124,28 +223,39 @@ class ExpertiseRegistry:
         Args:
             domain: Domain to search for (e.g., 'security', 'architecture')
             min_weight: Minimum expertise weight threshold (default: 0.5)
+            limit: Return at most this many agents (default: all)
 
         Returns:
             List of AgentExpertise objects sorted by expertise (highest first)
         """
-        relevant = []
-
-        for agent in self._cache.values():
-            # Skip abstainers
-            if agent.council_role == CouncilRole.ABSTAINER:
-                continue
+        key = (domain, min_weight)
+        cached = self._relevant_cache.get(key)
+        if cached is not None:
+            return list(cached[:limit])
+
+        if min_weight > 0.0:
+            # Agents are pre-sorted by weight; cut the tail below min_weight
+            neg_weights, agents = self._by_domain.get(domain, ([], []))
+            relevant = agents[: bisect.bisect_right(neg_weights, -min_weight)]
+        else:
+            # Agents without this domain (weight 0.0) qualify too
+            abstainer = CouncilRole.ABSTAINER
+            candidates = (
+                agent
+                for agent in self._cache.values()
+                if agent.council_role is not abstainer
+            )
 
-            # Check domain expertise
-            expertise_weight = agent.get_expertise(domain, default=0.0)
-            if expertise_weight >= min_weight:
-                relevant.append(agent)
+            def rank(agent: AgentExpertise) -> float:
+                return agent.get_expertise(domain, default=0.0)
 
-        # Sort by expertise weight (descending)
-        relevant.sort(
-            key=lambda a: a.get_expertise(domain, default=0.0), reverse=True
-        )
+            if limit is not None:
+                # Top-K without sorting (or caching) the rejected tail
+                return heapq.nlargest(limit, candidates, key=rank)
+            relevant = sorted(candidates, key=rank, reverse=True)
 
-        return relevant
+        self._relevant_cache[key] = tuple(relevant)
+        return relevant[:limit]
 
     def get_agent_expertise(self, agent_name: str) -> Optional[AgentExpertise]:
         """
@@ -159,49 +269,73 @@ class ExpertiseRegistry:
         """
         return self._cache.get(agent_name)
 
+    def expertise_weight(
+        self, agent_name: str, domain: str, default: float = 0.5
+    ) -> float:
+        """
+        Get an agent's expertise weight for a domain in one lookup.
+
+        Args:
+            agent_name: Agent name (e.g., 'security-auditor')
+            domain: Domain (e.g., 'security')
+            default: Weight for unknown agents or domains (default: 0.5)
+
+        Returns:
+            Expertise weight (0-1)
+        """
+        agent = self._cache.get(agent_name)
+        if agent is None:
+            return default
+        return agent.expertise_weights.get(domain, default)
+
     def list_all_agents(self) -> List[str]:
         """Get names of all loaded agents"""
         return sorted(self._cache.keys())
 
     def get_domains(self) -> List[str]:
         """Get all unique domains across all agents"""
-        domains = set()
-        for agent in self._cache.values():
-            domains.update(agent.expertise_weights.keys())
-        return sorted(domains)
+        return list(self._domains)
 
     def get_proposers(self) -> List[AgentExpertise]:
         """Get all agents with proposer role"""
-        return [
-            agent
-            for agent in self._cache.values()
-            if agent.council_role == CouncilRole.PROPOSER
-        ]
+        return list(self._proposers)
 
     def reload(self) -> None:
         """Reload all agent profiles from disk"""
         self._cache.clear()
+        self._relevant_cache.clear()
+        self._by_domain = {}
+        self._proposers = ()
+        self._domains = ()
         self._load_all_agents()
 
 
 # Singleton instance
 _registry: Optional[ExpertiseRegistry] = None
+_registry_lock = threading.Lock()
 
 
 def get_registry() -> ExpertiseRegistry:
-    """Get singleton ExpertiseRegistry instance (lazy initialization)"""
+    """Get singleton ExpertiseRegistry instance (lazy, thread-safe initialization)"""
     global _registry
-    if _registry is None:
-        _registry = ExpertiseRegistry()
-    return _registry
+    registry = _registry
+    if registry is None:
+        # Double-checked so concurrent first calls scan the agents directory once
+        with _registry_lock:
+            registry = _registry
+            if registry is None:
+                registry = _registry = ExpertiseRegistry()
+    return registry
 
 
 # Convenience functions
 
 
-def get_relevant_agents(domain: str, min_weight: float = 0.5) -> List[AgentExpertise]:
+def get_relevant_agents(
+    domain: str, min_weight: float = 0.5, limit: Optional[int] = None
+) -> List[AgentExpertise]:
     """Find agents with expertise in domain (convenience wrapper)"""
-    return get_registry().get_relevant_agents(domain, min_weight)
+    return get_registry().get_relevant_agents(domain, min_weight, limit)
 
 
 def get_agent_expertise(agent_name: str) -> Optional[AgentExpertise]:
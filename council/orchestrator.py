@@ -13,14 +13,18 @@ Key Functions:
 - _execute_council_workflow(): Full workflow execution
 """
 
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from typing import List, Optional, Tuple
-from uuid import uuid4
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from council.debate_manager import DebateManager
-from council.expertise_registry import ExpertiseRegistry
-from council.proposal_generator import ProposalGenerator
 from council.schemas import (
     CouncilSession,
     CouncilTrigger,
@@ -28,9 +32,83 @@ from council.schemas import (
     Vote,
     VoteType,
     VotingResult,
+    fast_uuid,
+)
+
+if TYPE_CHECKING:
+    # Components are imported on first use in CouncilOrchestrator.__init__ so
+    # importing this module (e.g. for convene_council) stays cheap
+    from council.debate_manager import DebateManager
+    from council.expertise_registry import ExpertiseRegistry
+    from council.proposal_generator import ProposalGenerator
+    from council.state_manager import StateManager
+    from council.voting_aggregator import VotingAggregator
+
+# Runs external model consultations so a hung call can time out
+_escalation_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="council-escalation"
 )
-from council.state_manager import StateManager
-from council.voting_aggregator import VotingAggregator
+
+# Progress and escalation messages (silent unless "council" logging is enabled)
+_log = logging.getLogger("council")
+
+# Escalation model configuration, read once at import (see
+# CouncilOrchestrator._select_escalation_model). Unset means consult-llm
+# auto-selects: o3 > gemini > claude-opus > deepseek based on availability.
+_CRITICAL_MODEL = os.getenv("COUNCIL_CRITICAL_MODEL") or None
+_COMPLEX_MODEL = os.getenv("COUNCIL_COMPLEX_MODEL") or None
+_DEFAULT_MODEL = os.getenv("COUNCIL_DEFAULT_MODEL") or None
+
+# Domains that escalate to the critical model
+_CRITICAL_DOMAINS = frozenset({"security", "architecture", "ethics"})
+
+
+@functools.lru_cache(maxsize=32)
+def _select_escalation_model_cached(domain: str, is_complex: bool) -> Optional[str]:
+    """Resolve the escalation model for a domain and reason bucket"""
+    if domain in _CRITICAL_DOMAINS:
+        return _CRITICAL_MODEL
+    if is_complex:
+        return _COMPLEX_MODEL
+    return _DEFAULT_MODEL
+
+
+# Escalation prompt templates (see CouncilOrchestrator._build_escalation_prompt)
+_ESCALATION_HEADER = """You are an expert consultant for a multi-agent council.
+
+**ESCALATION CONTEXT**
+
+Domain: {domain}
+Operation: {operation_text}
+Escalation Reason: {escalation_reason}
+
+**PROPOSALS FROM AGENTS**
+
+"""
+
+_ESCALATION_PROPOSAL = """
+{index}. {agent_name} (confidence: {confidence:.2f})
+   Recommendation: {recommendation}
+   Reasoning: {reasoning}...
+"""
+
+_ESCALATION_FOOTER = """
+
+**VOTING RESULT**
+
+Aggregate Confidence: {aggregate_confidence:.2f}
+Winner Score: {winning_score:.3f}
+Needs Escalation: {escalation_reason}
+
+**YOUR TASK**
+
+Review the proposals and provide:
+1. Which proposal (if any) you recommend
+2. Why you chose it
+3. What the council should consider
+4. Confidence in your recommendation (0-1)
+
+Be concise but thorough."""
 
 
 class CouncilOrchestrator:
@@ -58,15 +136,36 @@ class CouncilOrchestrator:
         Args:
             registry: ExpertiseRegistry (creates if None)
             proposal_generator: ProposalGenerator (creates if None)
-            debate_manager: DebateManager (creates if None)
+            debate_manager: DebateManager (creates from COUNCIL_DEBATE_* if None)
             voting_aggregator: VotingAggregator (creates if None)
             state_manager: StateManager (creates if None)
         """
-        self.registry = registry or ExpertiseRegistry()
-        self.proposal_generator = proposal_generator or ProposalGenerator(self.registry)
-        self.debate_manager = debate_manager or DebateManager()
-        self.voting_aggregator = voting_aggregator or VotingAggregator()
-        self.state_manager = state_manager or StateManager()
+        if registry is None:
+            from council.expertise_registry import ExpertiseRegistry
+
+            registry = ExpertiseRegistry()
+        if proposal_generator is None:
+            from council.proposal_generator import ProposalGenerator
+
+            proposal_generator = ProposalGenerator(registry)
+        if debate_manager is None:
+            from council.debate_manager import DebateManager
+
+            debate_manager = DebateManager.from_env()
+        if voting_aggregator is None:
+            from council.voting_aggregator import VotingAggregator
+
+            voting_aggregator = VotingAggregator()
+        if state_manager is None:
+            from council.state_manager import StateManager
+
+            state_manager = StateManager()
+
+        self.registry = registry
+        self.proposal_generator = proposal_generator
+        self.debate_manager = debate_manager
+        self.voting_aggregator = voting_aggregator
+        self.state_manager = state_manager
 
     def convene_council(
         self,
@@ -89,7 +188,7 @@ class CouncilOrchestrator:
 
         # Create session
         session = CouncilSession(
-            session_id=uuid4(),
+            session_id=fast_uuid(),
             trigger=trigger,
             participating_agents=[],
         )
@@ -100,7 +199,7 @@ class CouncilOrchestrator:
 
         except Exception as e:
             # Log error but preserve partial session
-            print(f"Council workflow error: {e}")
+            _log.error("Council workflow error: %s", e)
             session.decision = f"ERROR: {str(e)}"
             session.decision_confidence = 0.0
 
@@ -134,7 +233,7 @@ class CouncilOrchestrator:
         operation_text = session.trigger.operation_text
 
         # Step 1: Generate proposals from relevant agents
-        print(f"\n[Council] Generating proposals for {domain}...")
+        _log.info("Generating proposals for %s...", domain)
         proposals = self.proposal_generator.generate_proposals(
             domain=domain,
             operation_text=operation_text,
@@ -147,13 +246,17 @@ class CouncilOrchestrator:
 
         # Track participating agents
         session.participating_agents = [p.agent_name for p in proposals]
-        print(f"[Council] {len(proposals)} proposals from: {', '.join(session.participating_agents)}")
+        _log.info(
+            "%d proposals from: %s",
+            len(proposals),
+            ", ".join(session.participating_agents),
+        )
 
         # Step 2: Check if debate is needed
         should_debate, debate_reason = self.debate_manager.should_debate(proposals)
 
         if should_debate:
-            print(f"[Council] Debate triggered: {debate_reason}")
+            _log.info("Debate triggered: %s", debate_reason)
             debate_rounds = self.debate_manager.conduct_debate(
                 proposals, domain, operation_text
             )
@@ -162,15 +265,15 @@ class CouncilOrchestrator:
             # Use refined proposals from final round
             if debate_rounds:
                 proposals = debate_rounds[-1].proposals
-                print(f"[Council] Completed {len(debate_rounds)} debate round(s)")
+                _log.info("Completed %d debate round(s)", len(debate_rounds))
         else:
-            print(f"[Council] Skipping debate: {debate_reason}")
+            _log.info("Skipping debate: %s", debate_reason)
 
         # Step 3: Generate votes from proposals
         votes = self._generate_votes_from_proposals(proposals, domain)
 
         # Step 4: Aggregate votes using DWA
-        print(f"[Council] Aggregating {len(votes)} votes using DWA...")
+        _log.info("Aggregating %d votes using DWA...", len(votes))
         voting_result = self.voting_aggregator.aggregate_votes(
             votes, proposals, session.session_id
         )
@@ -180,7 +283,7 @@ class CouncilOrchestrator:
 
         # Step 5: Check for escalation
         if voting_result.needs_escalation:
-            print(f"[Council] Escalation needed: {voting_result.escalation_reason}")
+            _log.info("Escalation needed: %s", voting_result.escalation_reason)
             session.escalated_to_external = True
 
             # Phase 3: Consult external model for tie-breaking or confidence boost
@@ -190,7 +293,7 @@ class CouncilOrchestrator:
 
             if escalation_result:
                 # External model provided additional insight
-                print(f"[Council] External consultation result: {escalation_result[:80]}...")
+                _log.info("External consultation result: %.80s...", escalation_result)
                 # Use external result to boost confidence or break tie
                 # For now, log it; Phase 4 will integrate into voting
 
@@ -202,8 +305,8 @@ class CouncilOrchestrator:
         if winning_proposal:
             session.decision = winning_proposal.recommendation
             session.decision_confidence = voting_result.aggregate_confidence
-            print(f"[Council] Decision: {session.decision[:80]}...")
-            print(f"[Council] Confidence: {session.decision_confidence:.2f}")
+            _log.info("Decision: %.80s...", session.decision)
+            _log.info("Confidence: %.2f", session.decision_confidence)
         else:
             session.decision = "No clear winner - manual review required"
             session.decision_confidence = 0.0
@@ -230,27 +333,24 @@ class CouncilOrchestrator:
         Returns:
             List of Vote objects
         """
-        votes = []
-
-        for proposal in proposals:
-            # Get agent expertise for domain
-            agent = self.registry.get_agent_expertise(proposal.agent_name)
-            expertise_weight = (
-                agent.get_expertise(domain, default=0.5) if agent else 0.5
-            )
-
-            # Agent votes for own proposal
-            vote = Vote(
+        # Resolve each participating agent's domain expertise once
+        expertise_weights = {
+            agent_name: self.registry.expertise_weight(agent_name, domain)
+            for agent_name in {proposal.agent_name for proposal in proposals}
+        }
+
+        # Each agent votes for own proposal
+        return [
+            Vote(
                 agent_name=proposal.agent_name,
                 proposal_id=proposal.proposal_id,
                 vote_type=VoteType.APPROVE,
                 confidence=proposal.confidence,
-                expertise_weight=expertise_weight,
+                expertise_weight=expertise_weights[proposal.agent_name],
                 rationale=f"Own proposal with confidence {proposal.confidence:.2f}",
             )
-            votes.append(vote)
-
-        return votes
+            for proposal in proposals
+        ]
 
     def _handle_escalation(
         self,
@@ -281,40 +381,25 @@ class CouncilOrchestrator:
         preferred_model = self._select_escalation_model(domain, voting_result.escalation_reason)
 
         try:
-            model_desc = preferred_model if preferred_model else "auto-selected model"
-            print(f"[Council] Consulting {model_desc} for escalation...", file=sys.stderr)
-
-            # Phase 4: Call external model consultation wrapper
-            # This wrapper provides bridge to consult-llm MCP
-            import subprocess
+            _log.info(
+                "Consulting %s for escalation...", preferred_model or "auto-selected model"
+            )
 
-            wrapper_script = Path(__file__).parent / "consult_external_model.py"
-            cmd = ["python3", str(wrapper_script), "--prompt", prompt, "--format", "text"]
+            # In-process call on a worker thread so the 60s timeout still applies
+            # (no interpreter startup or argv-size limit per escalation)
+            from council.consult_external_model import consult
 
-            if preferred_model:
-                cmd.extend(["--model", preferred_model])
+            future = _escalation_executor.submit(consult, prompt, preferred_model)
+            response = future.result(timeout=60)  # Allow time for external model processing
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,  # Allow time for external model processing
-            )
+            _log.info("External consultation complete")
+            return response
 
-            if result.returncode == 0:
-                response = result.stdout.strip()
-                print(f"[Council] External consultation complete", file=sys.stderr)
-                return response
-            else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                print(f"[Council] Escalation failed: {error_msg}", file=sys.stderr)
-                return None
-
-        except subprocess.TimeoutExpired:
-            print(f"[Council] Escalation timed out after 60s", file=sys.stderr)
+        except FuturesTimeoutError:
+            _log.warning("Escalation timed out after 60s")
             return None
         except Exception as e:
-            print(f"[Council] Escalation error: {e}", file=sys.stderr)
+            _log.warning("Escalation error: %s", e)
             return None
 
     def _build_escalation_prompt(
@@ -325,52 +410,41 @@ class CouncilOrchestrator:
         voting_result: VotingResult,
     ) -> str:
         """Build prompt for external model escalation"""
-        prompt = f"""You are an expert consultant for a multi-agent council.
-
-**ESCALATION CONTEXT**
-
-Domain: {domain}
-Operation: {operation_text}
-Escalation Reason: {voting_result.escalation_reason}
-
-**PROPOSALS FROM AGENTS**
-
-"""
-        for i, proposal in enumerate(proposals, 1):
-            prompt += f"""
-{i}. {proposal.agent_name} (confidence: {proposal.confidence:.2f})
-   Recommendation: {proposal.recommendation}
-   Reasoning: {', '.join(proposal.reasoning_chain[:2])}...
-"""
-
-        prompt += f"""
-
-**VOTING RESULT**
-
-Aggregate Confidence: {voting_result.aggregate_confidence:.2f}
-Winner Score: {voting_result.winning_score:.3f}
-Needs Escalation: {voting_result.escalation_reason}
-
-**YOUR TASK**
-
-Review the proposals and provide:
-1. Which proposal (if any) you recommend
-2. Why you chose it
-3. What the council should consider
-4. Confidence in your recommendation (0-1)
-
-Be concise but thorough."""
+        parts = [
+            _ESCALATION_HEADER.format(
+                domain=domain,
+                operation_text=operation_text,
+                escalation_reason=voting_result.escalation_reason,
+            )
+        ]
+        parts.extend(
+            _ESCALATION_PROPOSAL.format(
+                index=i,
+                agent_name=proposal.agent_name,
+                confidence=proposal.confidence,
+                recommendation=proposal.recommendation,
+                reasoning=", ".join(proposal.reasoning_chain[:2]),
+            )
+            for i, proposal in enumerate(proposals, 1)
+        )
+        parts.append(
+            _ESCALATION_FOOTER.format(
+                aggregate_confidence=voting_result.aggregate_confidence,
+                winning_score=voting_result.winning_score,
+                escalation_reason=voting_result.escalation_reason,
+            )
+        )
 
-        return prompt
+        return "".join(parts)
 
-    def _select_escalation_model(self, domain: str, reason: str) -> str:
+    def _select_escalation_model(self, domain: str, reason: str) -> Optional[str]:
         """
         Select external model for escalation dynamically.
 
         Uses environment variables or falls back to intelligent defaults.
         Models are selected based on domain criticality and cost optimization.
 
-        Environment Variables:
+        Environment Variables (read once at import):
             COUNCIL_CRITICAL_MODEL: Model for security/architecture/ethics (default: auto-detect)
             COUNCIL_COMPLEX_MODEL: Model for complex reasoning (default: auto-detect)
             COUNCIL_DEFAULT_MODEL: Model for general escalation (default: auto-detect)
@@ -380,35 +454,11 @@ Be concise but thorough."""
             reason: Escalation reason
 
         Returns:
-            Model identifier compatible with consult-llm MCP
+            Model identifier compatible with consult-llm MCP (None to auto-select)
         """
-        import os
-
-        # Load from environment or use intelligent defaults
-        # Default selection: Uses consult-llm's auto-detection if no env vars set
-        critical_model = os.getenv("COUNCIL_CRITICAL_MODEL", None)
-        complex_model = os.getenv("COUNCIL_COMPLEX_MODEL", None)
-        default_model = os.getenv("COUNCIL_DEFAULT_MODEL", None)
-
-        # If no env vars set, use consult-llm's auto-selection
-        # consult-llm will choose best available model
-        if not any([critical_model, complex_model, default_model]):
-            # Return None to let consult-llm auto-select
-            # consult-llm will use: o3 > gemini > claude-opus > deepseek based on availability
-            if domain in ["security", "architecture", "ethics"]:
-                return None  # Let consult-llm choose best critical model
-            if "complex" in reason.lower():
-                return None  # Let consult-llm choose best reasoning model
-            return None  # Let consult-llm choose cost-effective model
-
-        # Use configured models if env vars set
-        if domain in ["security", "architecture", "ethics"]:
-            return critical_model or None
-
-        if "complex" in reason.lower():
-            return complex_model or None
-
-        return default_model or None
+        return _select_escalation_model_cached(
+            domain, "complex" in (reason or "").lower()
+        )
 
     def get_session_summary(self, session_id) -> Optional[dict]:
         """
@@ -425,14 +475,19 @@ Be concise but thorough."""
 
 # Singleton instance
 _orchestrator: Optional[CouncilOrchestrator] = None
+_orchestrator_lock = threading.Lock()
 
 
 def get_orchestrator() -> CouncilOrchestrator:
-    """Get singleton CouncilOrchestrator instance (lazy initialization)"""
+    """Get singleton CouncilOrchestrator instance (lazy, thread-safe initialization)"""
     global _orchestrator
-    if _orchestrator is None:
-        _orchestrator = CouncilOrchestrator()
-    return _orchestrator
+    orchestrator = _orchestrator
+    if orchestrator is None:
+        with _orchestrator_lock:
+            orchestrator = _orchestrator
+            if orchestrator is None:
+                orchestrator = _orchestrator = CouncilOrchestrator()
+    return orchestrator
 
 
 # Convenience function
@@ -7,21 +7,191 @@ Collects independent proposals from relevant agents using:
 
 Key Functions:
 - generate_proposals(): Collect proposals from selected agents
+- agenerate_proposals(): Async variant; agents are queried concurrently
 - _generate_single_proposal(): Generate proposal from one agent
 - _select_model_for_domain(): Choose Ollama vs Claude based on domain
 """
 
+import asyncio
+import hashlib
+import http.client
 import json
+import logging
+import os
+import re
+import socket
 import sys
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
-from uuid import uuid4
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for MCP imports
 sys.path.insert(0, str(Path.home() / ".claude"))
 
+from pydantic import BaseModel, ValidationError
+
 from council.expertise_registry import ExpertiseRegistry
-from council.schemas import AgentExpertise, Proposal
+from council.schemas import AgentExpertise, Proposal, fast_uuid, utcnow
+
+_log = logging.getLogger("council")
+
+
+def _server_url(host: str) -> str:
+    """Normalize 'host:port' or a full URL to a base URL without trailing slash"""
+    return (host if "://" in host else f"http://{host}").rstrip("/")
+
+
+# Ollama server (same OLLAMA_HOST variable the ollama CLI uses)
+_OLLAMA_URL = _server_url(os.getenv("OLLAMA_HOST", "127.0.0.1:11434"))
+
+# Optional llama.cpp server (llama-server --parallel N --cont-batching); when
+# set, local proposals use it instead of Ollama
+_LLAMACPP_URL = (
+    _server_url(os.environ["COUNCIL_LLAMACPP_URL"])
+    if os.getenv("COUNCIL_LLAMACPP_URL")
+    else None
+)
+
+# How long Ollama keeps a model loaded after a request (avoids reload thrash)
+_OLLAMA_KEEP_ALIVE = "10m"
+
+# Stream lines read after the proposal's JSON object closes while waiting for
+# Ollama's final "done" line; past this the stream is abandoned (connection
+# closed, which also stops generation) instead of drained for reuse
+_OLLAMA_MAX_TRAILING_LINES = 16
+
+# Constrains llama.cpp sampling to the proposal shape (grammar-enforced)
+_PROPOSAL_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "recommendation": {"type": "string"},
+        "reasoning_chain": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 1,
+        },
+        "confidence": {"type": "number"},
+        "domain_relevance": {"type": "number"},
+    },
+    "required": ["recommendation", "reasoning_chain", "confidence", "domain_relevance"],
+}
+
+# Seconds a generated proposal is reused for an identical request
+_PROPOSAL_CACHE_TTL = 3600.0
+
+# Most proposals kept for reuse (least recently used are evicted first)
+_PROPOSAL_CACHE_SIZE = 256
+
+# Markdown code fence around a model response (```json ... ```)
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|\n?```\Z")
+
+
+class _ProposalPayload(BaseModel):
+    """Fields every proposal response must provide (parsed and validated in one pass)"""
+
+    recommendation: str
+    reasoning_chain: List[str]
+    confidence: float
+    domain_relevance: float
+
+
+# Agent-independent part of every proposal prompt; the per-agent details
+# (identity, domain, operation, context) are appended after it
+_STATIC_PROMPT_PREFIX = """**COUNCIL DELIBERATION TASK**
+
+An operation requires multi-agent deliberation. You are one of the council's
+expert agents; your identity, domain and the operation follow these instructions.
+
+**YOUR TASK:**
+Provide a structured proposal with:
+
+1. **Recommendation** (1-2 sentences): Your recommended action/decision
+2. **Reasoning Chain** (3-5 bullet points): Step-by-step logic
+3. **Confidence** (0.0-1.0): How confident are you in this recommendation?
+4. **Domain Relevance** (0.0-1.0): How relevant is this to your expertise?
+
+**OUTPUT FORMAT (JSON):**
+{
+  "recommendation": "Your concise recommendation here",
+  "reasoning_chain": [
+    "First reasoning step",
+    "Second reasoning step",
+    "Third reasoning step"
+  ],
+  "confidence": 0.85,
+  "domain_relevance": 0.90
+}
+
+**IMPORTANT:**
+- Be honest about confidence (don't overstate certainty)
+- Domain relevance should reflect your expertise in the given domain
+- Reasoning should be clear and logical
+- Output ONLY valid JSON
+"""
+
+# Full proposal prompt, filled with a single format_map() per agent (the
+# prefix's literal JSON braces are escaped)
+_PROMPT_TEMPLATE = (
+    _STATIC_PROMPT_PREFIX.replace("{", "{{").replace("}", "}}")
+    + "\nYou are {name}, an expert in {domain} (expertise: {expertise:.1f}/1.0).\n\n"
+    + "**Domain:** {domain}\n"
+    + "**Operation:** {operation}\n"
+    + "{context_block}"
+)
+
+
+def _strip_code_fences(response: str) -> str:
+    """Remove a surrounding markdown code fence, if any"""
+    response = response.strip()
+    if response.startswith("```"):
+        response = _FENCE_RE.sub("", response).strip()
+    return response
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally finds where a streamed top-level JSON object closes.
+
+    Braces inside string literals are ignored, so a recommendation that
+    mentions '{' or '}' does not end the object early.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> int:
+        """
+        Scan the next chunk of streamed text.
+
+        Args:
+            text: Next chunk of the response
+
+        Returns:
+            Index just past the closing brace within text, or -1 if the
+            object is still open
+        """
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return index + 1
+        return -1
 
 
 class ProposalGenerator:
@@ -49,6 +219,22 @@ class ProposalGenerator:
             "reasoning": "qwen3-coder:30b",  # Long-context analysis
             "deep": "gpt-oss:20b",  # Deeper reasoning
         }
+        self._model_for_domain, self._fast_model = self._resolve_domain_models()
+
+        # Concurrent model requests per council; matches the server's decode
+        # slots so extra requests are not queued behind them
+        self._max_parallel = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+        # Idle keep-alive model server connections by base URL. Owned by the
+        # generator, not by worker threads, so they outlive each council's
+        # asyncio.run() and its default executor
+        self._idle_connections: Dict[str, List[http.client.HTTPConnection]] = {}
+        self._idle_connections_lock = threading.Lock()
+
+        # Proposal cache (LRU order): sha256(agent, domain, operation,
+        # context, model) → (monotonic creation time, proposal)
+        self._proposal_cache: "OrderedDict[str, Tuple[float, Proposal]]" = OrderedDict()
+        self._proposal_cache_lock = threading.Lock()
 
     def generate_proposals(
         self,
@@ -61,6 +247,41 @@ class ProposalGenerator:
         """
         Generate proposals from relevant agents.
 
+        Synchronous wrapper around agenerate_proposals() for callers that
+        are not running an event loop.
+
+        Args:
+            domain: Domain requiring deliberation (e.g., 'security', 'api_design')
+            operation_text: Text of operation being evaluated
+            context: Additional context for agents
+            max_agents: Maximum number of agents to query
+            min_expertise: Minimum expertise weight threshold
+
+        Returns:
+            List of Proposal objects from agents
+        """
+        return asyncio.run(
+            self.agenerate_proposals(
+                domain, operation_text, context, max_agents, min_expertise
+            )
+        )
+
+    async def agenerate_proposals(
+        self,
+        domain: str,
+        operation_text: str,
+        context: Optional[str] = None,
+        max_agents: int = 5,
+        min_expertise: float = 0.5,
+    ) -> List[Proposal]:
+        """
+        Generate proposals from relevant agents concurrently (async).
+
+        Each agent's model call runs in a worker thread, so wall time is the
+        slowest agent's latency rather than the sum over all agents. At most
+        OLLAMA_NUM_PARALLEL (default 4) requests are in flight at once. A
+        failing agent is logged and skipped; it never aborts the council.
+
         Args:
             domain: Domain requiring deliberation (e.g., 'security', 'api_design')
             operation_text: Text of operation being evaluated
@@ -72,29 +293,46 @@ class ProposalGenerator:
             List of Proposal objects from agents
         """
         # Select relevant agents
-        relevant_agents = self.registry.get_relevant_agents(domain, min_expertise)
-        selected_agents = relevant_agents[:max_agents]
+        selected_agents = self.registry.get_relevant_agents(
+            domain, min_expertise, limit=max_agents
+        )
 
         if not selected_agents:
             # Fallback: get top proposers if no domain experts
             all_proposers = self.registry.get_proposers()
             selected_agents = all_proposers[:min(3, len(all_proposers))]
 
-        # Generate proposals in parallel (simulate for now)
-        proposals = []
-        for agent in selected_agents:
-            try:
-                proposal = self._generate_single_proposal(
-                    agent, domain, operation_text, context
-                )
-                if proposal:
-                    proposals.append(proposal)
-            except Exception as e:
-                print(
-                    f"Warning: Failed to generate proposal from {agent.name}: {e}",
-                    file=sys.stderr,
+        # Generate proposals in parallel, at most _max_parallel at a time
+        # (created per call: asyncio primitives are bound to one event loop)
+        semaphore = asyncio.Semaphore(self._max_parallel)
+
+        async def generate(agent: AgentExpertise) -> Proposal:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._generate_single_proposal,
+                    agent,
+                    domain,
+                    operation_text,
+                    context,
                 )
-                continue
+
+        results = await asyncio.gather(
+            *[generate(agent) for agent in selected_agents],
+            return_exceptions=True,
+        )
+
+        proposals = []
+        errors = []
+        for agent, result in zip(selected_agents, results):
+            if isinstance(result, Exception):
+                errors.append(f"{agent.name}: {result}")
+            elif result:
+                proposals.append(result)
+
+        if errors:
+            _log.warning(
+                "Failed to generate %d proposal(s): %s", len(errors), "; ".join(errors)
+            )
 
         return proposals
 
@@ -104,7 +342,7 @@ class ProposalGenerator:
         domain: str,
         operation_text: str,
         context: Optional[str],
-    ) -> Optional[Proposal]:
+    ) -> Proposal:
         """
         Generate a single proposal from an agent.
 
@@ -115,40 +353,113 @@ class ProposalGenerator:
             context: Additional context
 
         Returns:
-            Proposal object or None if generation fails
+            Proposal object
+
+        Raises:
+            Exception: If the model call or response parsing fails (collected
+                and logged once per council by agenerate_proposals())
         """
         # Select model based on domain criticality
         model = self._select_model_for_domain(domain)
 
+        # Repeated deliberations (retries, tests) reuse the earlier proposal
+        cache_key = self._proposal_cache_key(
+            agent, domain, operation_text, context, model
+        )
+        cached = self._get_cached_proposal(cache_key)
+        if cached is not None:
+            return cached
+
         # Build prompt for agent
         prompt = self._build_proposal_prompt(
             agent, domain, operation_text, context
         )
 
         # Generate proposal using selected model
-        try:
-            if model.startswith("claude"):
-                # Use Claude API (future: integrate with consult-llm MCP)
-                response = self._generate_with_claude(prompt, model)
-            else:
-                # Use Ollama MCP
-                response = self._generate_with_ollama(prompt, model)
-
-            # Parse structured response
-            return self._parse_proposal_response(agent, response, model, domain)
-
-        except Exception as e:
-            print(
-                f"Error generating proposal with {model} for {agent.name}: {e}",
-                file=sys.stderr,
-            )
-            return None
+        if model.startswith("claude"):
+            # Use Claude API (future: integrate with consult-llm MCP)
+            response = self._generate_with_claude(prompt, model)
+        elif _LLAMACPP_URL:
+            # Use llama.cpp server (serves whichever model it was started with)
+            response = self._generate_with_llamacpp(prompt)
+        else:
+            # Use Ollama MCP
+            response = self._generate_with_ollama(prompt, model)
+
+        # Parse structured response
+        proposal = self._parse_proposal_response(agent, response, model, domain)
+
+        self._store_cached_proposal(cache_key, proposal)
+        return proposal
+
+    @staticmethod
+    def _proposal_cache_key(
+        agent: AgentExpertise,
+        domain: str,
+        operation_text: str,
+        context: Optional[str],
+        model: str,
+    ) -> str:
+        """Hash everything that determines a proposal's prompt and model"""
+        payload = json.dumps(
+            {
+                "agent": agent.name,
+                "domain": domain,
+                "op": operation_text,
+                "ctx": context,
+                "model": model,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    def _select_model_for_domain(self, domain: str) -> str:
+    def _get_cached_proposal(self, cache_key: str) -> Optional[Proposal]:
         """
-        Select appropriate model based on domain criticality.
+        Return a fresh copy of a cached proposal, or None on miss/expiry.
+
+        The copy gets a new proposal_id and timestamp so sessions never share
+        proposal identities.
+        """
+        with self._proposal_cache_lock:
+            entry = self._proposal_cache.get(cache_key)
+            if entry is None:
+                return None
+            created, proposal = entry
+            if time.monotonic() - created > _PROPOSAL_CACHE_TTL:
+                del self._proposal_cache[cache_key]
+                return None
+            self._proposal_cache.move_to_end(cache_key)
+
+        return proposal.model_copy(
+            update={"proposal_id": fast_uuid(), "timestamp": utcnow()}, deep=True
+        )
+
+    def _store_cached_proposal(self, cache_key: str, proposal: Proposal) -> None:
+        """
+        Cache a proposal, dropping expired and least recently used entries.
 
-        Uses environment variables for model mapping, falls back to intelligent defaults.
+        Keys that never repeat would otherwise stay forever, since expired
+        entries are only noticed on lookup.
+        """
+        with self._proposal_cache_lock:
+            cache = self._proposal_cache
+            now = time.monotonic()
+            cache[cache_key] = (now, proposal)
+            cache.move_to_end(cache_key)
+
+            # Drop expired entries from the least recently used end
+            while cache:
+                oldest_key, (created, _) = next(iter(cache.items()))
+                if now - created <= _PROPOSAL_CACHE_TTL:
+                    break
+                del cache[oldest_key]
+
+            while len(cache) > _PROPOSAL_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _resolve_domain_models(self) -> Tuple[Dict[str, str], str]:
+        """
+        Resolve the domain → model mapping from the environment once.
 
         Environment Variables:
             COUNCIL_PROPOSAL_CRITICAL: Model for critical domains (default: auto-detect)
@@ -156,35 +467,49 @@ class ProposalGenerator:
             COUNCIL_PROPOSAL_REASONING: Model for complex reasoning (default: qwen3-coder:30b)
             COUNCIL_PROPOSAL_FAST: Model for general proposals (default: llama3.2)
 
-        Args:
-            domain: Domain requiring proposal
-
         Returns:
-            Model identifier compatible with Ollama or consult-llm
+            Tuple of (model per known domain, fallback model for other domains)
         """
-        import os
-
         # Load from environment or use defaults
         critical_model = os.getenv("COUNCIL_PROPOSAL_CRITICAL", None)
         code_model = os.getenv("COUNCIL_PROPOSAL_CODE", self.local_models["code"])
         reasoning_model = os.getenv("COUNCIL_PROPOSAL_REASONING", self.local_models["reasoning"])
         fast_model = os.getenv("COUNCIL_PROPOSAL_FAST", self.local_models["fast"])
 
-        # Critical domains can use external models if configured
-        # Default: Use fast local model (cost-free)
-        if domain in self.critical_domains:
-            return critical_model or fast_model  # Fallback to local if not configured
+        model_for_domain = {}
+
+        # Complex reasoning
+        model_for_domain.update(
+            dict.fromkeys(("architecture", "database", "performance"), reasoning_model)
+        )
 
         # Code/API domains
-        if domain in ["api_design", "backend", "frontend"]:
-            return code_model
+        model_for_domain.update(
+            dict.fromkeys(("api_design", "backend", "frontend"), code_model)
+        )
 
-        # Complex reasoning
-        if domain in ["architecture", "database", "performance"]:
-            return reasoning_model
+        # Critical domains can use external models if configured (applied
+        # last so they take precedence); fallback to local if not configured
+        model_for_domain.update(
+            dict.fromkeys(self.critical_domains, critical_model or fast_model)
+        )
+
+        return model_for_domain, fast_model
+
+    def _select_model_for_domain(self, domain: str) -> str:
+        """
+        Select appropriate model based on domain criticality.
+
+        The mapping is resolved from environment variables at construction
+        (see _resolve_domain_models()); unknown domains use the fast local model.
 
-        # Default: fast local model
-        return fast_model
+        Args:
+            domain: Domain requiring proposal
+
+        Returns:
+            Model identifier compatible with Ollama or consult-llm
+        """
+        return self._model_for_domain.get(domain, self._fast_model)
 
     def _build_proposal_prompt(
         self,
@@ -207,97 +532,220 @@ class ProposalGenerator:
         """
         expertise_level = agent.get_expertise(domain, default=0.5)
 
-        prompt = f"""You are {agent.name}, an expert in {domain} (expertise: {expertise_level:.1f}/1.0).
+        # Static instructions first, so every agent's prompt shares one prefix
+        # the model server can reuse from its prompt cache
+        return _PROMPT_TEMPLATE.format_map(
+            {
+                "name": agent.name,
+                "domain": domain,
+                "expertise": expertise_level,
+                "operation": operation_text,
+                "context_block": f"**Context:** {context}\n" if context else "",
+            }
+        )
 
-**COUNCIL DELIBERATION TASK**
+    def _generate_with_ollama(self, prompt: str, model: str) -> str:
+        """
+        Generate response using the Ollama HTTP API.
 
-An operation requires multi-agent deliberation:
+        Args:
+            prompt: Prompt text
+            model: Ollama model name
 
-**Domain:** {domain}
-**Operation:** {operation_text}
+        Returns:
+            Generated text response
+        """
+        # Ollama HTTP API: no ollama CLI process per proposal, and concurrent
+        # requests are decoded in parallel (see OLLAMA_NUM_PARALLEL)
+        payload = json.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "format": "json",  # Force JSON output
+                "stream": True,  # Stop reading as soon as the JSON object closes
+                "keep_alive": _OLLAMA_KEEP_ALIVE,  # Keep model loaded between calls
+            }
+        ).encode("utf-8")
+
+        scanner = _JsonObjectScanner()
+        chunks = []
+        try:
+            connection, http_response = self._post(_OLLAMA_URL, "/api/generate", payload)
+            reusable = False
+            try:
+                closed = False
+                trailing = 0
+                # One JSON object per line, each carrying the next tokens
+                for line in http_response:
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if closed:
+                        trailing += 1
+                    else:
+                        text = event.get("response", "")
+                        end = scanner.feed(text)
+                        if end >= 0:
+                            # Skip the model's trailing tokens (whitespace, repeats)
+                            chunks.append(text[:end])
+                            closed = True
+                        else:
+                            chunks.append(text)
+
+                    if event.get("done"):
+                        # Consume the end of the chunked body so the
+                        # connection can carry the next request
+                        http_response.read()
+                        reusable = True
+                        break
+                    if trailing > _OLLAMA_MAX_TRAILING_LINES:
+                        break
+                else:
+                    reusable = True
+            finally:
+                if reusable:
+                    self._release_connection(_OLLAMA_URL, connection)
+                else:
+                    # Stream abandoned mid-response: closing the connection
+                    # tells Ollama to stop generating
+                    connection.close()
+        except socket.timeout:
+            raise Exception(f"Ollama generation timeout (60s) for {model}")
+        except ConnectionRefusedError as e:
+            raise Exception(f"Ollama not reachable at {_OLLAMA_URL}: {e}")
 
-{f'**Context:** {context}' if context else ''}
+        # Ollama with format=json should return pure JSON
+        # But some models may still wrap it, so handle both cases
+        return _strip_code_fences("".join(chunks))
 
-**YOUR TASK:**
-Provide a structured proposal with:
+    def _generate_with_llamacpp(self, prompt: str) -> str:
+        """
+        Generate response using a llama.cpp server.
 
-1. **Recommendation** (1-2 sentences): Your recommended action/decision
-2. **Reasoning Chain** (3-5 bullet points): Step-by-step logic
-3. **Confidence** (0.0-1.0): How confident are you in this recommendation?
-4. **Domain Relevance** (0.0-1.0): How relevant is this to your expertise?
+        Args:
+            prompt: Prompt text
 
-**OUTPUT FORMAT (JSON):**
-{{
-  "recommendation": "Your concise recommendation here",
-  "reasoning_chain": [
-    "First reasoning step",
-    "Second reasoning step",
-    "Third reasoning step"
-  ],
-  "confidence": 0.85,
-  "domain_relevance": 0.90
-}}
+        Returns:
+            Generated text response
+        """
+        payload = json.dumps(
+            {
+                "prompt": prompt,
+                "json_schema": _PROPOSAL_JSON_SCHEMA,
+                "n_predict": 512,
+                "cache_prompt": True,  # Reuse the shared prompt prefix
+            }
+        ).encode("utf-8")
 
-**IMPORTANT:**
-- Be honest about confidence (don't overstate certainty)
-- Domain relevance should reflect your expertise in {domain}
-- Reasoning should be clear and logical
-- Output ONLY valid JSON
-"""
+        try:
+            body = json.loads(self._post_json(_LLAMACPP_URL, "/completion", payload))
+        except socket.timeout:
+            raise Exception("llama.cpp generation timeout (60s)")
+        except ConnectionRefusedError as e:
+            raise Exception(f"llama.cpp server not reachable at {_LLAMACPP_URL}: {e}")
 
-        return prompt
+        return _strip_code_fences(body.get("content", ""))
 
-    def _generate_with_ollama(self, prompt: str, model: str) -> str:
+    def _post_json(self, base_url: str, path: str, payload: bytes) -> bytes:
         """
-        Generate response using Ollama MCP.
+        POST a JSON payload over a pooled keep-alive connection to base_url.
 
         Args:
-            prompt: Prompt text
-            model: Ollama model name
+            base_url: Server base URL (e.g., 'http://127.0.0.1:11434')
+            path: API path (e.g., '/api/generate')
+            payload: Encoded JSON request body
 
         Returns:
-            Generated text response
-        """
-        # Phase 3: Use Ollama MCP server for better integration
-        # The MCP server provides ollama_generate and ollama_chat tools
-        # For Phase 3, we'll use subprocess with --json for structured output
-        import subprocess
+            Raw response body
 
+        Raises:
+            Exception: If the server returns a non-200 status
+        """
+        connection, http_response = self._post(base_url, path, payload)
         try:
-            # Call ollama with JSON format enforcement
-            # This ensures we get valid JSON responses for parsing
-            result = subprocess.run(
-                [
-                    "ollama",
-                    "run",
-                    model,
-                    "--format", "json",  # Force JSON output
-                    prompt,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,  # Increased timeout for larger models
-            )
+            body = http_response.read()
+        except Exception:
+            connection.close()
+            raise
+        self._release_connection(base_url, connection)
+        return body
+
+    def _post(
+        self, base_url: str, path: str, payload: bytes
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a JSON POST and return the connection with its unread 200 response.
 
-            if result.returncode == 0:
-                response = result.stdout.strip()
+        The caller owns the connection: after reading the body to the end it
+        hands it back with _release_connection(), otherwise it closes it.
 
-                # Ollama with --format json should return pure JSON
-                # But some models may still wrap it, so handle both cases
-                if response.startswith("```"):
-                    # Strip markdown if present
-                    lines = response.split("\n")
-                    lines = [l for l in lines if not l.strip().startswith("```")]
-                    response = "\n".join(lines).strip()
+        Args:
+            base_url: Server base URL (e.g., 'http://127.0.0.1:11434')
+            path: API path (e.g., '/api/generate')
+            payload: Encoded JSON request body
 
-                return response
-            else:
-                raise Exception(f"Ollama error: {result.stderr}")
+        Returns:
+            Tuple of (connection, response positioned at the start of the body)
 
-        except subprocess.TimeoutExpired:
-            raise Exception(f"Ollama generation timeout (60s) for {model}")
-        except FileNotFoundError:
-            raise Exception("Ollama not installed or not in PATH")
+        Raises:
+            Exception: If the server returns a non-200 status
+        """
+        for attempt in range(2):
+            # Retry on a new connection, not another possibly stale idle one
+            connection = self._checkout_connection(base_url, reuse=not attempt)
+
+            try:
+                connection.request(
+                    "POST", path, body=payload, headers={"Content-Type": "application/json"}
+                )
+                http_response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server dropped the idle keep-alive connection: reconnect once
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+
+            if http_response.status != 200:
+                body = http_response.read()
+                self._release_connection(base_url, connection)
+                raise Exception(
+                    f"Model server error: {body.decode('utf-8', 'replace')}"
+                )
+            return connection, http_response
+
+    def _checkout_connection(
+        self, base_url: str, reuse: bool = True
+    ) -> http.client.HTTPConnection:
+        """Take an idle connection to base_url from the pool, or open a new one"""
+        if reuse:
+            with self._idle_connections_lock:
+                idle = self._idle_connections.get(base_url)
+                if idle:
+                    return idle.pop()
+
+        address = urllib.parse.urlsplit(base_url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if address.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        # Increased timeout for larger models
+        return connection_class(address.hostname, address.port, timeout=60)
+
+    def _release_connection(
+        self, base_url: str, connection: http.client.HTTPConnection
+    ) -> None:
+        """Return a connection whose response was fully read to the idle pool"""
+        with self._idle_connections_lock:
+            idle = self._idle_connections.setdefault(base_url, [])
+            if len(idle) < self._max_parallel:
+                idle.append(connection)
+                return
+        connection.close()
 
     def _generate_with_claude(self, prompt: str, model: str) -> str:
         """
@@ -336,43 +784,35 @@ Provide a structured proposal with:
             ValueError: If response cannot be parsed
         """
         # Extract JSON from response (handle markdown code blocks)
-        json_str = response.strip()
-
-        # Remove markdown code fences if present
-        if json_str.startswith("```"):
-            lines = json_str.split("\n")
-            # Remove first line (```json or ```)
-            lines = lines[1:]
-            # Remove last line (```)
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            json_str = "\n".join(lines)
-
-        # Parse JSON
+        json_str = _strip_code_fences(response)
+
+        # Parse and validate the JSON in a single pass
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON response from {model}: {e}")
-
-        # Validate required fields
-        required_fields = [
-            "recommendation",
-            "reasoning_chain",
-            "confidence",
-            "domain_relevance",
-        ]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field '{field}' in response")
-
-        # Create Proposal object
+            payload = _ProposalPayload.model_validate_json(json_str)
+        except ValidationError as e:
+            errors = e.errors()
+            if errors and errors[0]["type"] == "json_invalid":
+                raise ValueError(f"Invalid JSON response from {model}: {errors[0]['msg']}")
+            if errors and errors[0]["type"] == "model_type":
+                raise ValueError(f"Expected a JSON object from {model}")
+            missing = sorted(
+                str(error["loc"][0]) for error in errors if error["type"] == "missing"
+            )
+            if missing:
+                raise ValueError(
+                    f"Missing required field(s) {', '.join(missing)} in response"
+                )
+            raise ValueError(f"Invalid proposal response from {model}: {e}")
+
+        # Create Proposal object; agent and model names come from a small
+        # fixed vocabulary, so every proposal shares one interned string each
         return Proposal(
-            agent_name=agent.name,
-            recommendation=data["recommendation"],
-            reasoning_chain=data["reasoning_chain"],
-            confidence=float(data["confidence"]),
-            domain_relevance=float(data["domain_relevance"]),
-            model_used=model,
+            agent_name=sys.intern(agent.name),
+            recommendation=payload.recommendation,
+            reasoning_chain=payload.reasoning_chain,
+            confidence=payload.confidence,
+            domain_relevance=payload.domain_relevance,
+            model_used=sys.intern(model),
         )
 
 
@@ -11,41 +11,83 @@ Defines data models for:
 
 from __future__ import annotations
 
-from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional
+import itertools
+import os
+import unicodedata
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import Any, Annotated, Dict, List, Mapping, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
+# Enums live in a pydantic-free module so the trigger hot path can import
+# them cheaply; re-exported here for existing imports
+from .enums import CouncilRole, TriggerCondition, VoteType
 
-class CouncilRole(str, Enum):
-    """Agent's role in council deliberation"""
+# Expertise weight in [0, 1]
+ExpertiseWeight = Annotated[float, Field(ge=0.0, le=1.0)]
 
-    PROPOSER = "proposer"  # Generates proposals and votes
-    REVIEWER = "reviewer"  # Reviews but doesn't propose
-    ABSTAINER = "abstainer"  # Cannot participate
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime (replacement for datetime.utcnow)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
-class TriggerCondition(str, Enum):
-    """Conditions that trigger council convocation"""
 
-    ARCHITECTURAL = "architectural"  # Design choices, tech stack
-    SECURITY = "security"  # Auth, secrets, vulnerabilities
-    DISAGREEMENT = "disagreement"  # Agent conflicts
-    QUALITY_FAILURE = "quality_failure"  # TDD, linting, test failures
-    ETHICAL = "ethical"  # Privacy, bias concerns
-    LOW_CONFIDENCE = "low_confidence"  # Uncertainty < 0.75
-    EXTERNAL_COMMITMENT = "external_commitment"  # Deploys, API calls
-    NOVEL_QUERY = "novel_query"  # Out-of-distribution tasks
+# Per-process random high 64 bits + counter low 64 bits: unique within the
+# process without a getrandom() syscall per ID
+_ID_PREFIX = uuid4().int >> 64
+_ID_COUNTER = itertools.count()
 
 
-class VoteType(str, Enum):
-    """Types of votes in DWA system"""
+def _reseed_ids() -> None:
+    """Give a forked child its own ID prefix so it never repeats the parent's IDs"""
+    global _ID_PREFIX, _ID_COUNTER
+    _ID_PREFIX = uuid4().int >> 64
+    _ID_COUNTER = itertools.count()
 
-    APPROVE = "approve"  # Vote for this recommendation
-    REJECT = "reject"  # Vote against
-    ABSTAIN = "abstain"  # No opinion
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_ids)
+
+
+def fast_uuid() -> UUID:
+    """
+    Process-unique UUID (cheap replacement for uuid4 for council record IDs).
+
+    Raw 128-bit value (random prefix + counter): the RFC 4122 version and
+    variant bits are not set, so .version is None rather than 4.
+    """
+    return UUID(int=(_ID_PREFIX << 64) | next(_ID_COUNTER))
+
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> Tuple[str, ...]:
+    """Names of functools.cached_property attributes defined on cls or its bases"""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class _CachedPropertyModel(BaseModel):
+    """
+    BaseModel whose cached_property values are dropped by model_copy().
+
+    model_copy() copies __dict__, which also holds cached_property results, so
+    a copy made with update= would otherwise keep values derived from the
+    original fields (freezing does not stop update=). Copies recompute lazily.
+    """
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ):
+        copy = super().model_copy(update=update, deep=deep)
+        for name in _cached_property_names(type(self)):
+            copy.__dict__.pop(name, None)
+        return copy
 
 
 # ============================================================================
@@ -56,8 +98,11 @@ class VoteType(str, Enum):
 class AgentExpertise(BaseModel):
     """Agent expertise profile loaded from YAML frontmatter"""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Agent name (e.g., 'security-auditor')")
-    expertise_weights: Dict[str, float] = Field(
+    # Range checked by pydantic-core while parsing (no Python-level validator)
+    expertise_weights: Dict[str, ExpertiseWeight] = Field(
         default_factory=dict,
         description="Domain expertise weights (0-1), e.g., {'security': 1.0, 'api_design': 0.7}",
     )
@@ -69,17 +114,6 @@ class AgentExpertise(BaseModel):
     )
     description: Optional[str] = Field(None, description="Agent description from YAML")
 
-    @field_validator("expertise_weights")
-    @classmethod
-    def validate_weights(cls, v: Dict[str, float]) -> Dict[str, float]:
-        """Ensure all weights are between 0 and 1"""
-        for domain, weight in v.items():
-            if not 0 <= weight <= 1:
-                raise ValueError(
-                    f"Expertise weight for '{domain}' must be between 0 and 1, got {weight}"
-                )
-        return v
-
     def get_expertise(self, domain: str, default: float = 0.0) -> float:
         """Get expertise weight for domain, with fallback"""
         return self.expertise_weights.get(domain, default)
@@ -90,13 +124,15 @@ class AgentExpertise(BaseModel):
 # ============================================================================
 
 
-class Proposal(BaseModel):
+class Proposal(_CachedPropertyModel):
     """Agent proposal with reasoning chain and confidence"""
 
-    proposal_id: UUID = Field(default_factory=uuid4, description="Unique proposal ID")
+    model_config = ConfigDict(frozen=True)
+
+    proposal_id: UUID = Field(default_factory=fast_uuid, description="Unique proposal ID")
     agent_name: str = Field(..., description="Agent that generated this proposal")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Proposal creation time"
+        default_factory=utcnow, description="Proposal creation time"
     )
 
     # Proposal content
@@ -104,7 +140,7 @@ class Proposal(BaseModel):
         ..., description="Recommended action or decision", min_length=10
     )
     reasoning_chain: List[str] = Field(
-        ..., description="Step-by-step reasoning (chain-of-thought)", min_items=1
+        ..., description="Step-by-step reasoning (chain-of-thought)", min_length=1
     )
 
     # Confidence scoring
@@ -129,11 +165,16 @@ class Proposal(BaseModel):
         None, description="Time to generate proposal in milliseconds"
     )
 
-    @property
+    @cached_property
     def weighted_confidence(self) -> float:
-        """Confidence weighted by domain relevance"""
+        """Confidence weighted by domain relevance (computed once)"""
         return self.confidence * self.domain_relevance
 
+    @cached_property
+    def recommendation_key(self) -> str:
+        """Normalized recommendation for consensus grouping (computed once)"""
+        return unicodedata.normalize("NFKC", self.recommendation).strip().lower()
+
 
 # ============================================================================
 # Debate Models
@@ -143,10 +184,12 @@ class Proposal(BaseModel):
 class Critique(BaseModel):
     """Critique of another agent's proposal during debate"""
 
-    critique_id: UUID = Field(default_factory=uuid4)
+    model_config = ConfigDict(frozen=True)
+
+    critique_id: UUID = Field(default_factory=fast_uuid)
     source_agent: str = Field(..., description="Agent providing critique")
     target_proposal_id: UUID = Field(..., description="Proposal being critiqued")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
     critique_text: str = Field(..., description="Critique content", min_length=10)
     suggested_improvements: List[str] = Field(
@@ -161,7 +204,7 @@ class DebateRound(BaseModel):
     """Single round of debate with proposals and critiques"""
 
     round_number: int = Field(..., ge=1, description="Debate round number (1-2)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
     proposals: List[Proposal] = Field(
         default_factory=list, description="Proposals in this round"
@@ -184,13 +227,15 @@ class DebateRound(BaseModel):
 # ============================================================================
 
 
-class Vote(BaseModel):
+class Vote(_CachedPropertyModel):
     """Single vote in DWA aggregation"""
 
-    vote_id: UUID = Field(default_factory=uuid4)
+    model_config = ConfigDict(frozen=True)
+
+    vote_id: UUID = Field(default_factory=fast_uuid)
     agent_name: str = Field(..., description="Voting agent")
     proposal_id: UUID = Field(..., description="Proposal being voted on")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
     vote_type: VoteType = Field(..., description="Approve/Reject/Abstain")
     confidence: float = Field(
@@ -203,18 +248,19 @@ class Vote(BaseModel):
     # Reasoning
     rationale: Optional[str] = Field(None, description="Why this vote was cast")
 
-    @property
+    @cached_property
     def weighted_score(self) -> float:
-        """DWA formula: Vote × Confidence × Expertise"""
-        vote_value = 1.0 if self.vote_type == VoteType.APPROVE else 0.0
-        return vote_value * self.confidence * self.expertise_weight
+        """DWA formula: Vote × Confidence × Expertise (computed once)"""
+        if self.vote_type is not VoteType.APPROVE:
+            return 0.0
+        return self.confidence * self.expertise_weight
 
 
 class VotingResult(BaseModel):
     """Aggregated voting results with winner and statistics"""
 
     session_id: UUID = Field(..., description="Council session ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
     # Vote tallies
     votes: List[Vote] = Field(..., description="All votes cast")
@@ -255,7 +301,7 @@ class CouncilTrigger(BaseModel):
     """Information about why council was triggered"""
 
     condition: TriggerCondition = Field(..., description="Trigger condition type")
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    detected_at: datetime = Field(default_factory=utcnow)
     tool_name: Optional[str] = Field(None, description="Tool that triggered council")
     operation_text: str = Field(..., description="Text of operation being performed")
     inferred_domain: str = Field(
@@ -266,11 +312,11 @@ class CouncilTrigger(BaseModel):
     )
 
 
-class CouncilSession(BaseModel):
+class CouncilSession(_CachedPropertyModel):
     """Complete council deliberation session"""
 
-    session_id: UUID = Field(default_factory=uuid4, description="Unique session ID")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    session_id: UUID = Field(default_factory=fast_uuid, description="Unique session ID")
+    created_at: datetime = Field(default_factory=utcnow)
     completed_at: Optional[datetime] = None
 
     # Trigger information
@@ -310,6 +356,11 @@ class CouncilSession(BaseModel):
         None, description="External model if escalated"
     )
 
+    @cached_property
+    def session_id_str(self) -> str:
+        """Session ID as a string (computed once; model_copy() recomputes it)"""
+        return str(self.session_id)
+
     def add_debate_round(self, round: DebateRound) -> None:
         """Add a debate round to session"""
         self.debate_rounds.append(round)
@@ -322,7 +373,7 @@ class CouncilSession(BaseModel):
         duration_ms: int,
     ) -> None:
         """Mark session as complete"""
-        self.completed_at = datetime.utcnow()
+        self.completed_at = utcnow()
         self.decision = decision
         self.decision_confidence = confidence
         self.voting_result = voting_result
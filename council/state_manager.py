@@ -14,12 +14,98 @@ Key Functions:
 - get_session_summary(): Condensed session overview
 """
 
-import json
+import atexit
+import bisect
+import itertools
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from council.schemas import CouncilSession, VotingResult
+from council.schemas import CouncilSession, VotingResult, utcnow
+
+_log = logging.getLogger("council")
+
+# Buffered audit/decision rows per channel before one bulk write
+_FLUSH_THRESHOLD = 32
+
+# get_domain_statistics() covers at most this many of the newest sessions
+_STATS_MAX_SESSIONS = 1000
+
+# Index key of a stored session: (created_at, -first save order, session id)
+_TimeKey = Tuple[datetime, int, str]
+
+# Per-session statistics row:
+# (confidence if set and non-zero else 0.0, 1 if counted, duration_ms, escalated)
+_StatsRow = Tuple[float, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEntry:
+    """Row of the council:audit channel"""
+
+    timestamp: str
+    session_id: str
+    trigger: str
+    domain: str
+    risk_level: Optional[str]
+    agents: Tuple[str, ...]
+    decision: Optional[str]
+    confidence: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionIndexEntry:
+    """Row of the council:decisions channel"""
+
+    session_id: str
+    domain: str
+    decision: str
+    confidence: Optional[float]
+    timestamp: str
+
+
+@dataclass
+class _DomainStats:
+    """
+    One domain's session metrics in index order, with running totals.
+
+    prefix[i] holds the totals of rows[:i]; it is extended lazily, so
+    appending sessions (the common case) never recomputes earlier totals.
+    """
+
+    keys: List[_TimeKey] = field(default_factory=list)
+    rows: List[_StatsRow] = field(default_factory=list)
+    prefix: List[_StatsRow] = field(default_factory=lambda: [(0.0, 0, 0, 0)])
+
+    def insert(self, key: _TimeKey, row: _StatsRow) -> None:
+        """Add a session's row at its index position"""
+        index = bisect.bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.rows.insert(index, row)
+        del self.prefix[index + 1 :]
+
+    def remove(self, key: _TimeKey) -> None:
+        """Drop a session's row"""
+        index = bisect.bisect_left(self.keys, key)
+        del self.keys[index]
+        del self.rows[index]
+        del self.prefix[index + 1 :]
+
+    def totals(self, start: int, stop: int) -> _StatsRow:
+        """Sum of rows[start:stop]"""
+        prefix = self.prefix
+        for row in self.rows[len(prefix) - 1 : stop]:
+            last = prefix[-1]
+            prefix.append(
+                (last[0] + row[0], last[1] + row[1], last[2] + row[2], last[3] + row[3])
+            )
+        high, low = prefix[stop], prefix[start]
+        return (high[0] - low[0], high[1] - low[1], high[2] - low[2], high[3] - low[3])
 
 
 class StateManager:
@@ -37,7 +123,35 @@ class StateManager:
         self.channel_prefix = "council"
         # MCP integration will be added in Phase 3
         # For Phase 2, use in-memory storage for testing
-        self._sessions: Dict[str, CouncilSession] = {}
+        # Bounded LRU: the least recently saved/loaded session is evicted first
+        # (in Phase 3 it stays in memory-keeper and is fetched on a miss)
+        self._sessions: "OrderedDict[str, CouncilSession]" = OrderedDict()
+        self._max_sessions = max(1, int(os.getenv("COUNCIL_CACHE_SIZE", "10000")))
+        self._reset_indexes()
+        # Guards _sessions, the indices and _summary_cache (councils may save
+        # and query from several threads)
+        self._lock = threading.Lock()
+
+        # session id → get_session_summary() result (invalidated on save)
+        self._summary_cache: Dict[str, Dict] = {}
+
+        # Audit trail and decision index rows awaiting a bulk write
+        self._audit_buffer: List[AuditEntry] = []
+        self._index_buffer: List[DecisionIndexEntry] = []
+        self._buffer_lock = threading.Lock()
+
+    def _reset_indexes(self) -> None:
+        """Create empty secondary indices (maintained by save_session)"""
+        # domain → ids of sessions in that domain
+        self._by_domain: Dict[str, Set[str]] = {}
+        # (created_at, -first save order, session id), ascending; list_sessions
+        # walks it newest first. Equal timestamps keep first-saved-first order.
+        self._by_time: List[_TimeKey] = []
+        # session id → its current _by_time key and domain
+        self._index_keys: Dict[str, Tuple[_TimeKey, str]] = {}
+        # domain → running statistics, kept in _by_time order
+        self._domain_stats: Dict[str, _DomainStats] = {}
+        self._save_order = itertools.count()
 
     def save_session(self, session: CouncilSession) -> bool:
         """
@@ -50,14 +164,21 @@ class StateManager:
             True if saved successfully
         """
         try:
-            session_id = str(session.session_id)
+            session_id = session.session_id_str
 
             # Serialize session to JSON
             session_data = self._serialize_session(session)
 
             # Save to memory-keeper (Phase 3: use MCP)
             # For Phase 2: in-memory storage
-            self._sessions[session_id] = session
+            with self._lock:
+                self._sessions[session_id] = session
+                self._sessions.move_to_end(session_id)
+                self._index_session(session_id, session)
+
+                while len(self._sessions) > self._max_sessions:
+                    evicted_id, _ = self._sessions.popitem(last=False)
+                    self._unindex_session(evicted_id)
 
             # Also save to audit channel
             self._save_audit_entry(session)
@@ -68,7 +189,7 @@ class StateManager:
             return True
 
         except Exception as e:
-            print(f"Error saving session {session.session_id}: {e}")
+            _log.error("Error saving session %s: %s", session.session_id, e)
             return False
 
     def load_session(self, session_id: UUID) -> Optional[CouncilSession]:
@@ -83,8 +204,12 @@ class StateManager:
         """
         session_id_str = str(session_id)
 
-        # Phase 2: in-memory lookup
-        return self._sessions.get(session_id_str)
+        # Phase 2: in-memory lookup (Phase 3: fetch from MCP on a miss)
+        with self._lock:
+            session = self._sessions.get(session_id_str)
+            if session is not None:
+                self._sessions.move_to_end(session_id_str)
+        return session
 
     def list_sessions(
         self,
@@ -105,28 +230,33 @@ class StateManager:
         Returns:
             List of CouncilSession objects
         """
-        sessions = list(self._sessions.values())
-
-        # Apply filters
-        if domain:
-            sessions = [
-                s for s in sessions if s.trigger.inferred_domain == domain
-            ]
-
-        if min_confidence is not None:
-            sessions = [
-                s
-                for s in sessions
-                if s.decision_confidence and s.decision_confidence >= min_confidence
-            ]
-
-        if since:
-            sessions = [s for s in sessions if s.created_at >= since]
-
-        # Sort by creation time (newest first)
-        sessions.sort(key=lambda s: s.created_at, reverse=True)
-
-        return sessions[:limit]
+        if limit <= 0:
+            return []
+
+        # Consult the indices instead of filtering every stored session
+        with self._lock:
+            candidates = self._by_domain.get(domain, set()) if domain else None
+
+            sessions = []
+            for created_at, _, session_id in reversed(self._by_time):
+                if since and created_at < since:
+                    # Everything further along is older still
+                    break
+                if candidates is not None and session_id not in candidates:
+                    continue
+
+                session = self._sessions[session_id]
+                if min_confidence is not None and not (
+                    session.decision_confidence
+                    and session.decision_confidence >= min_confidence
+                ):
+                    continue
+
+                sessions.append(session)
+                if len(sessions) == limit:
+                    break
+
+        return sessions
 
     def get_session_summary(self, session_id: UUID) -> Optional[Dict]:
         """
@@ -138,22 +268,33 @@ class StateManager:
         Returns:
             Summary dict or None
         """
-        session = self.load_session(session_id)
-        if not session:
-            return None
+        session_id_str = str(session_id)
 
-        return {
-            "session_id": str(session.session_id),
-            "created_at": session.created_at.isoformat(),
-            "trigger_condition": session.trigger.condition.value,
-            "domain": session.trigger.inferred_domain,
-            "participating_agents": session.participating_agents,
-            "debate_rounds": len(session.debate_rounds),
-            "decision": session.decision,
-            "confidence": session.decision_confidence,
-            "duration_ms": session.total_duration_ms,
-            "escalated": session.escalated_to_external,
-        }
+        # Lookup, build and store in one critical section: a save or eviction
+        # in between would otherwise cache a stale or orphaned summary
+        with self._lock:
+            summary = self._summary_cache.get(session_id_str)
+            if summary is None:
+                session = self._sessions.get(session_id_str)
+                if session is None:
+                    return None
+                self._sessions.move_to_end(session_id_str)
+
+                summary = {
+                    "session_id": session.session_id_str,
+                    "created_at": session.created_at.isoformat(),
+                    "trigger_condition": session.trigger.condition.value,
+                    "domain": session.trigger.inferred_domain,
+                    "participating_agents": session.participating_agents,
+                    "debate_rounds": len(session.debate_rounds),
+                    "decision": session.decision,
+                    "confidence": session.decision_confidence,
+                    "duration_ms": session.total_duration_ms,
+                    "escalated": session.escalated_to_external,
+                }
+                self._summary_cache[session_id_str] = summary
+
+        return dict(summary)
 
     def get_domain_statistics(self, domain: str, days: int = 30) -> Dict:
         """
@@ -166,10 +307,21 @@ class StateManager:
         Returns:
             Statistics dict
         """
-        since = datetime.utcnow() - timedelta(days=days)
-        sessions = self.list_sessions(domain=domain, since=since, limit=1000)
-
-        if not sessions:
+        since = utcnow() - timedelta(days=days)
+
+        # Newest sessions since the cutoff, from the running totals
+        with self._lock:
+            stats = self._domain_stats.get(domain)
+            total_sessions = 0
+            if stats is not None:
+                stop = len(stats.keys)
+                start = max(
+                    bisect.bisect_left(stats.keys, (since,)), stop - _STATS_MAX_SESSIONS
+                )
+                total_sessions = stop - start
+                totals = stats.totals(start, stop)
+
+        if not total_sessions:
             return {
                 "domain": domain,
                 "total_sessions": 0,
@@ -177,26 +329,70 @@ class StateManager:
                 "escalation_rate": 0.0,
             }
 
-        total_sessions = len(sessions)
-        confidences = [
-            s.decision_confidence for s in sessions if s.decision_confidence
-        ]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        escalations = sum(1 for s in sessions if s.escalated_to_external)
-        escalation_rate = escalations / total_sessions if total_sessions > 0 else 0.0
+        confidence_sum, confidence_count, duration_sum, escalations = totals
+        avg_confidence = confidence_sum / confidence_count if confidence_count else 0.0
+        escalation_rate = escalations / total_sessions
 
         return {
             "domain": domain,
             "total_sessions": total_sessions,
             "avg_confidence": round(avg_confidence, 2),
             "escalation_rate": round(escalation_rate, 2),
-            "avg_duration_ms": round(
-                sum(s.total_duration_ms or 0 for s in sessions) / total_sessions, 0
-            )
-            if total_sessions > 0
-            else 0,
+            "avg_duration_ms": round(duration_sum / total_sessions, 0),
         }
 
+    def _index_session(self, session_id: str, session: CouncilSession) -> None:
+        """
+        Add (or refresh, on re-save) a stored session in the secondary indices.
+
+        Args:
+            session_id: Session ID string
+            session: CouncilSession just stored
+        """
+        # A re-saved session drops its old entries but keeps its original order
+        order = self._unindex_session(session_id)
+        if order is None:
+            order = -next(self._save_order)
+
+        domain = session.trigger.inferred_domain
+        key = (session.created_at, order, session_id)
+        bisect.insort(self._by_time, key)
+        self._by_domain.setdefault(domain, set()).add(session_id)
+        self._index_keys[session_id] = (key, domain)
+
+        confidence = session.decision_confidence
+        self._domain_stats.setdefault(domain, _DomainStats()).insert(
+            key,
+            (
+                confidence or 0.0,
+                1 if confidence else 0,
+                session.total_duration_ms or 0,
+                1 if session.escalated_to_external else 0,
+            ),
+        )
+
+    def _unindex_session(self, session_id: str) -> Optional[int]:
+        """
+        Remove a session from the secondary indices and summary cache.
+
+        Args:
+            session_id: Session ID string
+
+        Returns:
+            The session's save order key, or None if it was not indexed
+        """
+        self._summary_cache.pop(session_id, None)
+
+        previous = self._index_keys.pop(session_id, None)
+        if previous is None:
+            return None
+
+        key, domain = previous
+        del self._by_time[bisect.bisect_left(self._by_time, key)]
+        self._by_domain[domain].discard(session_id)
+        self._domain_stats[domain].remove(key)
+        return key[1]
+
     def _serialize_session(self, session: CouncilSession) -> str:
         """
         Serialize session to JSON string.
@@ -207,11 +403,9 @@ class StateManager:
         Returns:
             JSON string
         """
-        # Convert to dict (Pydantic model_dump)
-        session_dict = session.model_dump(mode="json")
-
-        # Convert UUIDs to strings
-        return json.dumps(session_dict, indent=2, default=str)
+        # Pydantic's Rust serializer writes JSON directly (UUIDs and datetimes
+        # included), skipping the intermediate dict and the Python encoder
+        return session.model_dump_json(indent=2)
 
     def _save_audit_entry(self, session: CouncilSession) -> None:
         """
@@ -220,23 +414,24 @@ class StateManager:
         Args:
             session: CouncilSession
         """
-        audit_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "session_id": str(session.session_id),
-            "trigger": session.trigger.condition.value,
-            "domain": session.trigger.inferred_domain,
-            "risk_level": session.trigger.risk_level,
-            "agents": session.participating_agents,
-            "decision": session.decision,
-            "confidence": session.decision_confidence,
-        }
+        audit_entry = AuditEntry(
+            timestamp=utcnow().isoformat(),
+            session_id=session.session_id_str,
+            trigger=session.trigger.condition.value,
+            domain=session.trigger.inferred_domain,
+            risk_level=session.trigger.risk_level,
+            agents=tuple(session.participating_agents),
+            decision=session.decision,
+            confidence=session.decision_confidence,
+        )
 
-        # Phase 3: Save to memory-keeper council:audit channel
-        # For Phase 2: log to stderr for visibility
-        print(
-            f"AUDIT: {audit_entry['trigger']} in {audit_entry['domain']} "
-            f"→ {audit_entry['decision'][:50] if audit_entry['decision'] else 'pending'}..."
+        _log.debug(
+            "AUDIT: %s in %s → %.50s...",
+            audit_entry.trigger,
+            audit_entry.domain,
+            audit_entry.decision or "pending",
         )
+        self._buffer_entry(self._audit_buffer, audit_entry)
 
     def _index_decision(self, session: CouncilSession) -> None:
         """
@@ -248,33 +443,86 @@ class StateManager:
         if not session.decision:
             return
 
-        index_entry = {
-            "session_id": str(session.session_id),
-            "domain": session.trigger.inferred_domain,
-            "decision": session.decision,
-            "confidence": session.decision_confidence,
-            "timestamp": session.created_at.isoformat(),
-        }
+        index_entry = DecisionIndexEntry(
+            session_id=session.session_id_str,
+            domain=session.trigger.inferred_domain,
+            decision=session.decision,
+            confidence=session.decision_confidence,
+            timestamp=session.created_at.isoformat(),
+        )
 
-        # Phase 3: Save to memory-keeper council:decisions channel
+        self._buffer_entry(self._index_buffer, index_entry)
+
+    def _buffer_entry(
+        self, buffer: List, entry: Union[AuditEntry, DecisionIndexEntry]
+    ) -> None:
+        """
+        Queue a row for the next bulk write, flushing once a buffer is full.
+
+        Args:
+            buffer: _audit_buffer or _index_buffer
+            entry: Row to write
+        """
+        with self._buffer_lock:
+            buffer.append(entry)
+            full = len(buffer) >= _FLUSH_THRESHOLD
+
+        if full:
+            self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Write buffered audit and decision index rows, one bulk write per channel.
+
+        Args:
+            force: Flush even if no buffer has reached the threshold
+        """
+        with self._buffer_lock:
+            if not force and (
+                len(self._audit_buffer) < _FLUSH_THRESHOLD
+                and len(self._index_buffer) < _FLUSH_THRESHOLD
+            ):
+                return
+            audit_entries, self._audit_buffer = self._audit_buffer, []
+            index_entries, self._index_buffer = self._index_buffer, []
+
+        # Phase 3: one memory-keeper write each to the council:audit and
+        # council:decisions channels
         # For Phase 2: in-memory only
-        pass
+        for channel, entries in (("audit", audit_entries), ("decisions", index_entries)):
+            if entries:
+                _log.debug(
+                    "Flushed %d entries to %s:%s", len(entries), self.channel_prefix, channel
+                )
 
     def clear_cache(self) -> None:
         """Clear in-memory session cache (for testing)"""
-        self._sessions.clear()
+        with self._lock:
+            self._sessions.clear()
+            self._reset_indexes()
+            self._summary_cache.clear()
+        with self._buffer_lock:
+            self._audit_buffer.clear()
+            self._index_buffer.clear()
 
 
 # Singleton instance
 _manager: Optional[StateManager] = None
+_manager_lock = threading.Lock()
 
 
 def get_manager() -> StateManager:
-    """Get singleton StateManager instance (lazy initialization)"""
+    """Get singleton StateManager instance (lazy, thread-safe initialization)"""
     global _manager
-    if _manager is None:
-        _manager = StateManager()
-    return _manager
+    manager = _manager
+    if manager is None:
+        with _manager_lock:
+            manager = _manager
+            if manager is None:
+                manager = _manager = StateManager()
+                # Don't lose buffered audit rows at interpreter exit
+                atexit.register(manager.flush, force=True)
+    return manager
 
 
 # Convenience functions
@@ -20,6 +20,7 @@ from uuid import uuid4
 # Add council package to path
 sys.path.insert(0, str(Path.home() / ".claude"))
 
+from council._test_runner import run_tests
 from council.debate_manager import DebateManager
 from council.expertise_registry import ExpertiseRegistry
 from council.orchestrator import CouncilOrchestrator
@@ -125,8 +126,9 @@ def test_full_council_workflow():
     # Generate votes
     votes = []
     for proposal in proposals:
-        agent = registry.get_agent_expertise(proposal.agent_name)
-        expertise_weight = agent.get_expertise(trigger.inferred_domain, 0.5) if agent else 0.5
+        expertise_weight = registry.expertise_weight(
+            proposal.agent_name, trigger.inferred_domain, 0.5
+        )
 
         from council.schemas import Vote, VoteType
         vote = Vote(
@@ -310,15 +312,8 @@ def main():
         test_hook_integration,
     ]
 
-    results = []
-    for test_func in tests:
-        try:
-            results.append(test_func())
-        except Exception as e:
-            print(f"\n✗ TEST FAILED WITH EXCEPTION: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append(False)
+    # Tests touch separate files, channels and sessions, so they run concurrently
+    results = run_tests(tests)
 
     # Summary
     print("\n" + "=" * 70)
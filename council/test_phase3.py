@@ -12,6 +12,8 @@ Tests end-to-end integration:
 Run: python3 ~/.claude/council/test_phase3.py
 """
 
+import functools
+import re
 import sys
 from pathlib import Path
 from uuid import uuid4
@@ -19,6 +21,7 @@ from uuid import uuid4
 # Add council package to path
 sys.path.insert(0, str(Path.home() / ".claude"))
 
+from council._test_runner import run_tests
 from council.orchestrator import CouncilOrchestrator
 from council.schemas import CouncilTrigger, TriggerCondition
 from council.trigger_detector import TriggerDetector
@@ -32,6 +35,34 @@ from lib.bus_publisher import (
 from lib.message_bus import MessageBus, MessageType, SourceType
 
 
+# Sections coordinator-agent.md must contain
+COORDINATOR_SECTIONS = (
+    "Agent Registry Management",
+    "Task Dispatch",
+    "Result Consolidation",
+    "Peer Facilitation",
+    "bus:coordination",
+    "bus:registry",
+    "bus:task-queue",
+    "bus:results",
+)
+_COORDINATOR_SECTIONS_RE = re.compile("|".join(map(re.escape, COORDINATOR_SECTIONS)))
+
+# Phase 3 integrations council_hook.py must contain
+HOOK_INTEGRATIONS = (
+    "from lib.bus_publisher import publish_council_decision",
+    "session = convene_council",
+    "publish_council_decision(",
+)
+_HOOK_INTEGRATIONS_RE = re.compile("|".join(map(re.escape, HOOK_INTEGRATIONS)))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_coordinator_text(path: Path) -> str:
+    """Read coordinator-agent.md once per run"""
+    return path.read_text()
+
+
 def test_message_bus_utilities():
     """Test 1: Message bus message formatting and structure"""
     print("\n" + "=" * 70)
@@ -149,22 +180,12 @@ def test_coordinator_agent_structure():
 
     print(f"  ✓ Coordinator agent file exists: {coordinator_path}")
 
-    # Check content
-    content = coordinator_path.read_text()
-
-    required_sections = [
-        "Agent Registry Management",
-        "Task Dispatch",
-        "Result Consolidation",
-        "Peer Facilitation",
-        "bus:coordination",
-        "bus:registry",
-        "bus:task-queue",
-        "bus:results",
-    ]
+    # Check content (one scan finds every required section)
+    content = _load_coordinator_text(coordinator_path)
+    found = set(_COORDINATOR_SECTIONS_RE.findall(content))
 
-    for section in required_sections:
-        if section in content:
+    for section in COORDINATOR_SECTIONS:
+        if section in found:
             print(f"  ✓ Has section: {section}")
         else:
             print(f"  ✗ FAIL: Missing section: {section}")
@@ -318,17 +339,11 @@ def test_hook_integration():
 
     print(f"  ✓ Council hook exists: {hook_path}")
 
-    # Check for Phase 3 integrations
-    content = hook_path.read_text()
-
-    required_imports = [
-        "from lib.bus_publisher import publish_council_decision",
-        "session = convene_council",
-        "publish_council_decision(",
-    ]
+    # Check for Phase 3 integrations (one scan finds every required snippet)
+    found = set(_HOOK_INTEGRATIONS_RE.findall(hook_path.read_text()))
 
-    for import_stmt in required_imports:
-        if import_stmt in content:
+    for import_stmt in HOOK_INTEGRATIONS:
+        if import_stmt in found:
             print(f"  ✓ Has integration: {import_stmt[:50]}...")
         else:
             print(f"  ✗ FAIL: Missing: {import_stmt}")
@@ -370,16 +385,8 @@ def main():
         test_hook_integration,
     ]
 
-    results = []
-    for test_func in tests:
-        try:
-            results.append(test_func())
-        except Exception as e:
-            print(f"\n✗ TEST FAILED WITH EXCEPTION: {e}")
-            import traceback
-
-            traceback.print_exc()
-            results.append(False)
+    # Tests touch separate files, channels and sessions, so they run concurrently
+    results = run_tests(tests)
 
     # Summary
     print("\n" + "=" * 70)
@@ -16,10 +16,29 @@ Key Functions:
 - infer_domain(): Map operation to domain (security, architecture, etc.)
 """
 
+from __future__ import annotations
+
+import functools
 import re
-from typing import List, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .enums import TriggerCondition
+
+if TYPE_CHECKING:
+    from .schemas import CouncilTrigger
+
+
+def _new_trigger(**fields) -> CouncilTrigger:
+    """
+    Build a CouncilTrigger.
+
+    The pydantic schemas are imported on the first detected trigger, so
+    hook processes where nothing triggers never pay for loading them.
+    """
+    from .schemas import CouncilTrigger
 
-from .schemas import CouncilTrigger, TriggerCondition
+    return CouncilTrigger(**fields)
 
 
 # ============================================================================
@@ -28,6 +47,7 @@ from .schemas import CouncilTrigger, TriggerCondition
 
 # Pattern format: (regex_pattern, trigger_condition, inferred_domain)
 # IMPORTANT: Security patterns come BEFORE architectural patterns (precedence)
+# Patterns must be lowercase: they are matched against lowercased text
 TRIGGER_PATTERNS = [
     # 2. SECURITY/RISK DECISIONS (check these FIRST - higher priority)
     (
@@ -114,6 +134,29 @@ TRIGGER_PATTERNS = [
 ]
 
 
+# Fallback domain keywords for infer_domain, in priority order
+DOMAIN_KEYWORDS = (
+    ("api_design", ("api", "endpoint", "rest", "graphql", "openapi")),
+    ("database", ("database", "query", "schema", "migration", "sql")),
+    ("testing", ("test", "testing", "pytest", "unittest")),
+    ("performance", ("performance", "optimize", "cache", "speed")),
+    ("devops", ("deploy", "docker", "kubernetes", "ci/cd")),
+    (
+        "frontend",
+        ("frontend", "react", "vue", "angular", "svelte", "component", "ui", "css"),
+    ),
+    ("backend", ("backend", "server", "fastapi", "django", "flask")),
+)
+
+# Only the head of an operation is scanned: Write/Edit operations carry whole
+# file contents, and the trigger vocabulary shows up in the first few KB
+_MATCH_TEXT_LIMIT = 4096
+
+# Distinct (truncated, lowercased) operation texts whose match results are memoized;
+# hooks see the same commands over and over
+_MATCH_CACHE_SIZE = 2048
+
+
 class TriggerDetector:
     """
     Detects conditions requiring council convocation.
@@ -124,10 +167,15 @@ class TriggerDetector:
 
     def __init__(self):
         """Initialize trigger detector with compiled patterns"""
+        # Patterns are all lowercase and run against lowercased text: plain
+        # case-sensitive matching is several times faster than re.IGNORECASE
         self.patterns = [
-            (re.compile(pattern, re.IGNORECASE), condition, domain)
+            (re.compile(pattern), condition, domain)
             for pattern, condition, domain in TRIGGER_PATTERNS
         ]
+        self._cached_match = functools.lru_cache(maxsize=_MATCH_CACHE_SIZE)(
+            self._match_patterns
+        )
 
     def detect_trigger(
         self,
@@ -138,6 +186,10 @@ class TriggerDetector:
         """
         Main entry point for trigger detection.
 
+        Only the first 4096 characters of operation_text are matched against
+        the trigger patterns, so large file contents cost no more to scan
+        than a command.
+
         Args:
             tool_name: Name of tool being invoked (e.g., 'Bash', 'Write', 'Edit')
             operation_text: Text description of operation (e.g., command, file content)
@@ -146,35 +198,24 @@ class TriggerDetector:
         Returns:
             CouncilTrigger if condition detected, None otherwise
         """
-        # High/Critical risk always triggers council
-        if risk_level in ("HIGH", "CRITICAL"):
-            condition, domain = self._match_patterns(operation_text)
-            if condition is None:
-                # Default to security for high-risk operations
-                condition = TriggerCondition.SECURITY
-                domain = "security"
-
-            return CouncilTrigger(
-                condition=condition,
-                tool_name=tool_name,
-                operation_text=operation_text[:500],  # Truncate for storage
-                inferred_domain=domain,
-                risk_level=risk_level,
-            )
-
-        # Pattern-based detection
-        condition, domain = self._match_patterns(operation_text)
-        if condition is not None:
-            return CouncilTrigger(
-                condition=condition,
-                tool_name=tool_name,
-                operation_text=operation_text[:500],
-                inferred_domain=domain,
-                risk_level=risk_level,
-            )
-
-        # No trigger detected
-        return None
+        # Pattern-based detection (one scan serves both paths)
+        condition, domain = self._classify(operation_text)
+
+        if condition is None:
+            if risk_level not in ("HIGH", "CRITICAL"):
+                # No trigger detected
+                return None
+            # High/Critical risk always triggers council; default to security
+            condition = TriggerCondition.SECURITY
+            domain = "security"
+
+        return _new_trigger(
+            condition=condition,
+            tool_name=tool_name,
+            operation_text=operation_text[:500],  # Truncate for storage
+            inferred_domain=domain,
+            risk_level=risk_level,
+        )
 
     def _match_patterns(
         self, text: str
@@ -182,6 +223,9 @@ class TriggerDetector:
         """
         Match operation text against trigger patterns.
 
+        Args:
+            text: Lowercased operation text
+
         Returns:
             Tuple of (TriggerCondition, domain) if match found, (None, None) otherwise
         """
@@ -191,6 +235,15 @@ class TriggerDetector:
 
         return None, None
 
+    def _classify(
+        self, text: str
+    ) -> Tuple[Optional[TriggerCondition], Optional[str]]:
+        """_match_patterns over the first _MATCH_TEXT_LIMIT chars, memoized"""
+        if len(text) > _MATCH_TEXT_LIMIT:
+            text = text[:_MATCH_TEXT_LIMIT]
+        # Lowercased key: texts differing only in case share one cache entry
+        return self._cached_match(text.lower())
+
     def detect_quality_failure(
         self, failure_type: str, details: str
     ) -> CouncilTrigger:
@@ -204,7 +257,7 @@ class TriggerDetector:
         Returns:
             CouncilTrigger for quality failure
         """
-        return CouncilTrigger(
+        return _new_trigger(
             condition=TriggerCondition.QUALITY_FAILURE,
             tool_name="quality_gate",
             operation_text=f"{failure_type}: {details[:400]}",
@@ -225,7 +278,7 @@ class TriggerDetector:
         Returns:
             CouncilTrigger for low confidence
         """
-        return CouncilTrigger(
+        return _new_trigger(
             condition=TriggerCondition.LOW_CONFIDENCE,
             tool_name="confidence_check",
             operation_text=f"Aggregate confidence {aggregate_confidence:.2f} < 0.75: {context[:400]}",
@@ -247,7 +300,7 @@ class TriggerDetector:
             CouncilTrigger for disagreement
         """
         agents_str = ", ".join(agent_proposals)
-        return CouncilTrigger(
+        return _new_trigger(
             condition=TriggerCondition.DISAGREEMENT,
             tool_name="disagreement_detector",
             operation_text=f"Agents disagree ({agents_str}): {conflict_summary[:400]}",
@@ -266,62 +319,37 @@ class TriggerDetector:
             Domain name (e.g., 'security', 'architecture', 'api_design')
         """
         # Try pattern matching first
-        for pattern, _, domain in self.patterns:
-            if pattern.search(text):
+        _, domain = self._classify(text)
+        if domain is not None:
+            return domain
+
+        # Keyword-based inference: lowercase once, first domain in priority
+        # order with any keyword substring wins
+        contains = text.lower().__contains__
+        for domain, keywords in DOMAIN_KEYWORDS:
+            if any(map(contains, keywords)):
                 return domain
 
-        # Keyword-based inference
-        text_lower = text.lower()
-
-        if any(
-            kw in text_lower
-            for kw in ["api", "endpoint", "rest", "graphql", "openapi"]
-        ):
-            return "api_design"
-
-        if any(
-            kw in text_lower
-            for kw in ["database", "query", "schema", "migration", "sql"]
-        ):
-            return "database"
-
-        if any(kw in text_lower for kw in ["test", "testing", "pytest", "unittest"]):
-            return "testing"
-
-        if any(
-            kw in text_lower for kw in ["performance", "optimize", "cache", "speed"]
-        ):
-            return "performance"
-
-        if any(kw in text_lower for kw in ["deploy", "docker", "kubernetes", "ci/cd"]):
-            return "devops"
-
-        if any(
-            kw in text_lower
-            for kw in ["frontend", "react", "vue", "angular", "svelte", "component", "ui", "css"]
-        ):
-            return "frontend"
-
-        if any(
-            kw in text_lower
-            for kw in ["backend", "server", "fastapi", "django", "flask"]
-        ):
-            return "backend"
-
         # Default
         return "general"
 
 
 # Singleton instance
 _detector: Optional[TriggerDetector] = None
+_detector_lock = threading.Lock()
 
 
 def get_detector() -> TriggerDetector:
-    """Get singleton TriggerDetector instance (lazy initialization)"""
+    """Get singleton TriggerDetector instance (lazy, thread-safe initialization)"""
     global _detector
-    if _detector is None:
-        _detector = TriggerDetector()
-    return _detector
+    detector = _detector
+    if detector is None:
+        # Double-checked so concurrent hook handlers compile the patterns once
+        with _detector_lock:
+            detector = _detector
+            if detector is None:
+                detector = _detector = TriggerDetector()
+    return detector
 
 
 # Convenience functions
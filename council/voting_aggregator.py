@@ -60,8 +60,8 @@ class VotingAggregator:
         if not votes:
             raise ValueError("Cannot aggregate empty vote list")
 
-        # Compute DWA scores for each proposal
-        proposal_scores = self._compute_dwa_scores(votes)
+        # One pass over votes: DWA scores, approval counts and confidence sum
+        proposal_scores, approval_counts, confidence_sum = self._tally_votes(votes)
 
         # Find winner (highest score)
         if not proposal_scores:
@@ -72,8 +72,8 @@ class VotingAggregator:
         )
 
         # Compute statistics
-        aggregate_confidence = self._compute_aggregate_confidence(votes)
-        vote_concentration_hhi = self._compute_hhi(votes)
+        aggregate_confidence = confidence_sum / len(votes)
+        vote_concentration_hhi = self._hhi_from_counts(approval_counts)
 
         # Check for tie
         is_tie = self._check_tie(proposal_scores, winning_score)
@@ -87,9 +87,7 @@ class VotingAggregator:
             session_id=session_id,
             votes=votes,
             proposal_scores={str(k): v for k, v in proposal_scores.items()},
-            winning_proposal_id=UUID(winning_proposal_id)
-            if winning_proposal_id
-            else None,
+            winning_proposal_id=winning_proposal_id,
             winning_score=winning_score,
             aggregate_confidence=aggregate_confidence,
             vote_concentration_hhi=vote_concentration_hhi,
@@ -98,50 +96,41 @@ class VotingAggregator:
             escalation_reason=escalation_reason,
         )
 
-    def _compute_dwa_scores(self, votes: List[Vote]) -> Dict[str, float]:
+    def _tally_votes(
+        self, votes: List[Vote]
+    ) -> Tuple[Dict[UUID, float], Dict[UUID, int], float]:
         """
-        Compute DWA weighted scores for each proposal.
+        Accumulate everything aggregation needs in a single pass over votes.
 
-        Formula: Score = Σ (Vote × Confidence × Expertise Weight)
+        DWA score per proposal: Score = Σ (Vote × Confidence × Expertise Weight)
         Where:
         - Vote = 1.0 for APPROVE, 0.0 for REJECT/ABSTAIN
         - Confidence = voter's confidence (0-1)
         - Expertise Weight = voter's domain expertise (0-1)
 
-        Returns:
-            Dict mapping proposal_id (str) → weighted_score (float)
-        """
-        scores: Dict[str, float] = {}
-
-        for vote in votes:
-            proposal_id = str(vote.proposal_id)
-
-            # Initialize score if first vote for this proposal
-            if proposal_id not in scores:
-                scores[proposal_id] = 0.0
-
-            # Add weighted score
-            scores[proposal_id] += vote.weighted_score
-
-        return scores
-
-    def _compute_aggregate_confidence(self, votes: List[Vote]) -> float:
-        """
-        Compute mean confidence across all votes.
-
         Args:
             votes: List of Vote objects
 
         Returns:
-            Mean confidence (0-1)
+            Tuple of (proposal_id → DWA score, proposal_id → APPROVE count,
+            sum of vote confidences)
         """
-        if not votes:
-            return 0.0
+        scores: Dict[UUID, float] = {}
+        approval_counts: Dict[UUID, int] = {}
+        confidence_sum = 0.0
+        approve = VoteType.APPROVE
+
+        for vote in votes:
+            proposal_id = vote.proposal_id
+            scores[proposal_id] = scores.get(proposal_id, 0.0) + vote.weighted_score
+            if vote.vote_type is approve:
+                approval_counts[proposal_id] = approval_counts.get(proposal_id, 0) + 1
+            confidence_sum += vote.confidence
 
-        total_confidence = sum(vote.confidence for vote in votes)
-        return total_confidence / len(votes)
+        return scores, approval_counts, confidence_sum
 
-    def _compute_hhi(self, votes: List[Vote]) -> float:
+    @staticmethod
+    def _hhi_from_counts(approval_counts: Dict[UUID, int]) -> float:
         """
         Compute Herfindahl-Hirschman Index (HHI) for vote concentration.
 
@@ -150,36 +139,24 @@ class VotingAggregator:
         - HHI → 0.0: Votes evenly distributed (high disagreement)
 
         Formula: HHI = Σ (share_i)^2
-        Where share_i = proportion of votes for proposal i
+        Where share_i = proportion of APPROVE votes for proposal i
 
         Args:
-            votes: List of Vote objects
+            approval_counts: Dict of proposal_id → APPROVE count
 
         Returns:
-            HHI score (0-1)
+            HHI score (0-1); 0.0 when nothing was approved
         """
-        if not votes:
-            return 0.0
-
-        # Count APPROVE votes per proposal
-        vote_counts: Dict[str, int] = {}
-        total_approvals = 0
-
-        for vote in votes:
-            if vote.vote_type == VoteType.APPROVE:
-                proposal_id = str(vote.proposal_id)
-                vote_counts[proposal_id] = vote_counts.get(proposal_id, 0) + 1
-                total_approvals += 1
-
+        total_approvals = sum(approval_counts.values())
         if total_approvals == 0:
             return 0.0  # No approvals = max disagreement
 
-        # Compute HHI
-        hhi = sum((count / total_approvals) ** 2 for count in vote_counts.values())
-
-        return hhi
+        # Σ (c/N)^2 == Σ c^2 / N^2: integer squares, then a single division
+        return sum(count * count for count in approval_counts.values()) / (
+            total_approvals * total_approvals
+        )
 
-    def _check_tie(self, proposal_scores: Dict[str, float], winning_score: float) -> bool:
+    def _check_tie(self, proposal_scores: Dict[UUID, float], winning_score: float) -> bool:
         """
         Check if results are tied (within threshold).
 
@@ -193,12 +170,15 @@ class VotingAggregator:
         if len(proposal_scores) < 2:
             return False
 
-        # Find second-highest score
-        sorted_scores = sorted(proposal_scores.values(), reverse=True)
-        if len(sorted_scores) < 2:
-            return False
-
-        second_score = sorted_scores[1]
+        # Second-highest score in one scan: skip the winner once, so a
+        # duplicate top score still counts as the runner-up
+        second_score = float("-inf")
+        winner_skipped = False
+        for score in proposal_scores.values():
+            if not winner_skipped and score == winning_score:
+                winner_skipped = True
+            elif score > second_score:
+                second_score = score
 
         # Check if within threshold
         score_diff = winning_score - second_score
@@ -223,9 +203,16 @@ class VotingAggregator:
         Returns:
             Tuple of (needs_escalation, reason)
         """
+        low_confidence = aggregate_confidence < self.confidence_threshold
+        high_disagreement = hhi < self.hhi_threshold
+
+        # Common case: nothing triggered, no reasons to collect
+        if not (low_confidence or is_tie or high_disagreement):
+            return False, None
+
         reasons = []
 
-        if aggregate_confidence < self.confidence_threshold:
+        if low_confidence:
             reasons.append(
                 f"Low confidence ({aggregate_confidence:.2f} < {self.confidence_threshold})"
             )
@@ -233,15 +220,12 @@ class VotingAggregator:
         if is_tie:
             reasons.append("Tie vote (within 5%)")
 
-        if hhi < self.hhi_threshold:
+        if high_disagreement:
             reasons.append(
                 f"High disagreement (HHI {hhi:.2f} < {self.hhi_threshold})"
             )
 
-        if reasons:
-            return True, "; ".join(reasons)
-
-        return False, None
+        return True, "; ".join(reasons)
 
     def get_winning_proposal(
         self, voting_result: VotingResult, proposals: List[Proposal]
@@ -256,11 +240,13 @@ class VotingAggregator:
         Returns:
             Winning Proposal object or None
         """
-        if voting_result.winning_proposal_id is None:
+        winning_id = voting_result.winning_proposal_id
+        if winning_id is None:
             return None
 
+        # Single lookup per session: an early-exit scan beats building an index
         for proposal in proposals:
-            if proposal.proposal_id == voting_result.winning_proposal_id:
+            if proposal.proposal_id == winning_id:
                 return proposal
 
         return None
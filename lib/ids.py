@@ -0,0 +1,34 @@
+"""
+Cheap unique IDs for message bus traffic
+
+Message, task and correlation IDs are generated on every hook and bus
+publish. They only need to be unique, not random, so each process draws
+64 random bits once and appends a counter - no getrandom() syscall and no
+UUID object per ID.
+
+Persisted council records keep uuid.UUID-typed IDs built the same way
+(see council.schemas.fast_uuid); neither sets RFC 4122 version/variant bits.
+"""
+
+import itertools
+import os
+
+# Per-process random prefix (16 hex chars) + counter (16 hex chars)
+_PREFIX = os.urandom(8).hex()
+_COUNTER = itertools.count()
+
+
+def _reseed() -> None:
+    """Give a forked child its own prefix so it never repeats the parent's IDs"""
+    global _PREFIX, _COUNTER
+    _PREFIX = os.urandom(8).hex()
+    _COUNTER = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+def short_id() -> str:
+    """Process-unique 32-character hex ID"""
+    return f"{_PREFIX}{next(_COUNTER):016x}"
@@ -10,6 +10,9 @@ Usage:
     # Publish message
     python3 memory_keeper_bridge.py publish --channel CHANNEL --key KEY --value VALUE [--priority PRIORITY]
 
+    # Publish several messages in one call (JSON lines on stdin)
+    python3 memory_keeper_bridge.py publish-batch < messages.jsonl
+
     # Subscribe/retrieve messages
     python3 memory_keeper_bridge.py subscribe --channel CHANNEL [--limit LIMIT]
 
@@ -18,11 +21,109 @@ For now, it provides simulated channel operations with JSON file storage.
 """
 
 import argparse
+import itertools
 import json
+import os
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, Iterator, List, Optional, Tuple
+
+# Compact JSON for storage lines and subscribe output (parsed by json.loads)
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp; one tuple so
+# concurrent callers never pair a prefix with the wrong second
+_ts_cache = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds and a "Z" suffix.
+
+    Same format as datetime.utcnow().isoformat() + "Z", without building a
+    datetime: the date/time prefix is formatted once per second.
+    """
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}Z"
+
+
+# Bytes kept from the end of a cached read to detect rewritten channel files
+_SENTINEL_BYTES = 64
+
+# Tail reads start with this many bytes and double until enough lines are found
+_TAIL_BLOCK = 64 * 1024
+
+
+def _matches(msg: Dict[str, Any], message_filter: Dict[str, Any]) -> bool:
+    return all(msg.get(k) == v for k, v in message_filter.items())
+
+
+def _reversed_lines(path: Path, end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Non-blank lines of a JSONL file, newest first, reading backwards from EOF.
+
+    `end` caps the read at a byte offset (e.g. the size from a prior stat())
+    instead of the current EOF. Blocks double in size as the scan goes back.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END) if end is None else end
+        block = _TAIL_BLOCK
+        partial = b""
+
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+
+            # First piece may be cut mid-line unless we reached the start of file
+            partial = lines.pop(0) if pos > 0 else b""
+            block *= 2
+
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+
+
+def _read_tail(
+    path: Path,
+    limit: int,
+    message_filter: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Last `limit` (matching) messages of a JSONL file, reading backwards from EOF.
+
+    Only the tail needed to satisfy `limit` is read and parsed, so cost follows
+    the limit rather than the channel's history.
+    """
+    found: List[Dict[str, Any]] = []  # newest first
+
+    for line in _reversed_lines(path):
+        msg = json.loads(line)
+        if message_filter and not _matches(msg, message_filter):
+            continue
+        found.append(msg)
+        if len(found) == limit:
+            break
+
+    found.reverse()
+    return found
+
+
+def _close_writers(writers: Dict[Path, Tuple[BinaryIO, int]]) -> None:
+    """Close kept-open channel writers (data is already flushed)"""
+    for f, _ in writers.values():
+        f.close()
+    writers.clear()
 
 
 class MemoryKeeperBridge:
@@ -34,16 +135,66 @@ class MemoryKeeperBridge:
         self.storage_dir = Path.home() / ".claude" / "council" / "bus_storage"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        # channel -> (mtime_ns, size, limit, last bytes before size,
+        # last `limit` raw lines) for unfiltered subscribes
+        self._tail_cache: Dict[str, Tuple[int, int, int, bytes, List[bytes]]] = {}
+
+        # channel file -> (append handle, inode it was opened on)
+        self._writers: Dict[Path, Tuple[BinaryIO, int]] = {}
+        self._writers_lock = threading.Lock()
+
+        # Handles close when the bridge is collected or at interpreter exit,
+        # whichever comes first
+        weakref.finalize(self, _close_writers, self._writers)
+
+    def _append(self, channel_file: Path, data: bytes) -> None:
+        """
+        Append data to a channel file through a kept-open handle.
+
+        Each call is one write() plus flush, so readers (and other processes)
+        see complete lines immediately. The handle is reopened if the file was
+        deleted or replaced since it was opened; that check is one stat() per
+        call, so an append costs stat + write instead of open + write + close.
+        """
+        with self._writers_lock:
+            writer = self._writers.get(channel_file)
+            if writer is not None:
+                f, inode = writer
+                try:
+                    stale = os.stat(channel_file).st_ino != inode
+                except FileNotFoundError:
+                    stale = True
+                if stale:
+                    f.close()
+                    writer = None
+
+            if writer is None:
+                f = open(channel_file, "ab")
+                self._writers[channel_file] = (f, os.fstat(f.fileno()).st_ino)
+
+            f.write(data)
+            f.flush()
+
+    def close(self) -> None:
+        """Close kept-open channel writers (data is already flushed)"""
+        with self._writers_lock:
+            _close_writers(self._writers)
+
     def publish(
         self,
         channel: str,
         key: str,
-        value: str,
-        priority: str = "normal"
+        value: Any,
+        priority: str = "normal",
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         Publish message to memory-keeper channel.
 
+        The value is stored as given: a dict is embedded as a JSON object
+        (encoded once, with the envelope), a string as a JSON string.
+        An already-stamped caller can pass its ISO timestamp to reuse it.
+
         Phase 4 TODO: Replace with actual MCP call:
         from mcp import tools
         tools.mcp__memory_keeper__context_save(
@@ -61,11 +212,46 @@ class MemoryKeeperBridge:
                 "key": key,
                 "value": value,
                 "priority": priority,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": timestamp or utc_timestamp()
             }
 
-            with open(channel_file, "a") as f:
-                f.write(json.dumps(message) + "\n")
+            self._append(channel_file, (_dumps(message) + "\n").encode())
+
+            return True
+
+        except Exception as e:
+            print(f"Publish error: {e}", file=sys.stderr)
+            return False
+
+    def publish_many(self, channel: str, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Publish several messages to one channel with a single write().
+
+        Args:
+            channel: Channel name
+            entries: Dicts with "key", "value" (stored as given) and optional "priority"
+
+        Returns:
+            True if all messages were written
+        """
+        if not entries:
+            return True
+
+        try:
+            channel_file = self.storage_dir / f"{channel}.jsonl"
+            timestamp = utc_timestamp()
+
+            buf = "".join(
+                _dumps({
+                    "key": entry["key"],
+                    "value": entry["value"],
+                    "priority": entry.get("priority", "normal"),
+                    "timestamp": timestamp
+                }) + "\n"
+                for entry in entries
+            )
+
+            self._append(channel_file, buf.encode())
 
             return True
 
@@ -95,28 +281,77 @@ class MemoryKeeperBridge:
             if not channel_file.exists():
                 return []
 
-            messages = []
-            with open(channel_file, "r") as f:
-                for line in f:
-                    if line.strip():
-                        msg = json.loads(line)
-                        messages.append(msg)
+            if limit <= 0:
+                # Non-positive limits slice from the front; keep full-read semantics
+                messages = []
+                with open(channel_file, "r") as f:
+                    for line in f:
+                        if line.strip():
+                            messages.append(json.loads(line))
+                if message_filter:
+                    messages = [msg for msg in messages if _matches(msg, message_filter)]
+                return messages[-limit:]
 
-            # Apply filter if provided
             if message_filter:
-                filtered = []
-                for msg in messages:
-                    if all(msg.get(k) == v for k, v in message_filter.items()):
-                        filtered.append(msg)
-                messages = filtered
+                return _read_tail(channel_file, limit, message_filter)
 
-            # Apply limit
-            return messages[-limit:]
+            return self._cached_tail(channel, channel_file, limit)
 
         except Exception as e:
             print(f"Subscribe error: {e}", file=sys.stderr)
             return []
 
+    def _cached_tail(
+        self,
+        channel: str,
+        channel_file: Path,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Last `limit` records of a channel, reusing the previous subscribe.
+
+        The cache holds raw lines and every call parses them again, so callers
+        always get records they own. An unchanged file (same mtime and size)
+        needs no I/O; a grown file only has its appended bytes read. The bytes
+        just before the old end must still match, otherwise the file was
+        rewritten and is re-read.
+        """
+        st = channel_file.stat()
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+
+        lines: Optional[List[bytes]] = None
+        sentinel = b""
+
+        cached = self._tail_cache.get(channel)
+        if cached is not None and cached[2] == limit:
+            cached_mtime_ns, cached_size, _, cached_sentinel, cached_lines = cached
+            if mtime_ns == cached_mtime_ns and size == cached_size:
+                lines, sentinel = cached_lines, cached_sentinel
+            elif size > cached_size:
+                start = cached_size - len(cached_sentinel)
+                with open(channel_file, "rb") as f:
+                    f.seek(start)
+                    chunk = f.read(size - start)
+                if chunk.startswith(cached_sentinel):
+                    appended = [
+                        line
+                        for line in chunk[len(cached_sentinel):].split(b"\n")
+                        if line.strip()
+                    ]
+                    lines = (cached_lines + appended)[-limit:]
+                    sentinel = chunk[-_SENTINEL_BYTES:]
+
+        if lines is None:
+            lines = list(itertools.islice(_reversed_lines(channel_file, end=size), limit))
+            lines.reverse()
+            with open(channel_file, "rb") as f:
+                f.seek(max(0, size - _SENTINEL_BYTES))
+                sentinel = f.read(size - f.tell())
+
+        records = [json.loads(line) for line in lines]
+        self._tail_cache[channel] = (mtime_ns, size, limit, sentinel, lines)
+        return records
+
 
 def main():
     parser = argparse.ArgumentParser(description="Memory Keeper MCP bridge for message bus")
@@ -129,6 +364,10 @@ def main():
     publish_parser.add_argument("--value", required=True, help="Message value (JSON)")
     publish_parser.add_argument("--priority", default="normal", choices=["high", "normal", "low"])
 
+    # Batch publish command (one JSON object per stdin line:
+    # {"channel": ..., "key": ..., "value": ..., "priority": ...})
+    subparsers.add_parser("publish-batch", help="Publish messages read from stdin")
+
     # Subscribe command
     subscribe_parser = subparsers.add_parser("subscribe", help="Subscribe to channel")
     subscribe_parser.add_argument("--channel", required=True, help="Channel name")
@@ -151,6 +390,21 @@ def main():
             else:
                 sys.exit(1)
 
+        elif args.operation == "publish-batch":
+            # Group by channel (order kept within each channel): one write per channel
+            by_channel: Dict[str, List[Dict[str, str]]] = {}
+            published = 0
+            for line in sys.stdin:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                by_channel.setdefault(entry["channel"], []).append(entry)
+                published += 1
+            for channel, entries in by_channel.items():
+                if not bridge.publish_many(channel, entries):
+                    sys.exit(1)
+            print(json.dumps({"status": "published", "count": published}))
+
         elif args.operation == "subscribe":
             message_filter = json.loads(args.filter) if args.filter else None
             messages = bridge.subscribe(
@@ -158,7 +412,7 @@ def main():
                 limit=args.limit,
                 message_filter=message_filter
             )
-            print(json.dumps(messages, indent=2))
+            print(_dumps(messages))
 
     except Exception as e:
         print(json.dumps({"error": str(e)}), file=sys.stderr)
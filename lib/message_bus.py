@@ -15,7 +15,7 @@ Channel Structure:
 
 Message Format:
 {
-  "message_id": "uuid",
+  "message_id": "short id (32 hex chars)",
   "timestamp": "ISO-8601",
   "message_type": "request|response|broadcast|event",
   "source": {"type": "agent|hook|skill", "id": "agent-name"},
@@ -29,13 +29,19 @@ Message Format:
 """
 
 import json
-import subprocess
 import sys
-from datetime import datetime
+import threading
 from enum import Enum
-from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Tuple
+
+from lib.ids import short_id
+from lib.memory_keeper_bridge import MemoryKeeperBridge, utc_timestamp
+
+# Accepted priorities (anything else publishes as "normal")
+_PRIORITIES = {"high": "high", "normal": "normal", "low": "low"}
+
+# (channel, message, priority) as taken by publish() and publish_many()
+_Entry = Tuple[str, Dict[str, Any], str]
 
 
 class MessageType(Enum):
@@ -73,8 +79,8 @@ class MessageBus:
 
     def __init__(self):
         """Initialize message bus"""
-        # Add lib path for imports
-        sys.path.insert(0, str(Path.home() / ".claude"))
+        # Bridge is called in-process; its CLI stays available to external callers
+        self._bridge = MemoryKeeperBridge()
 
     def create_message(
         self,
@@ -102,8 +108,8 @@ class MessageBus:
             Formatted message dict
         """
         message = {
-            "message_id": str(uuid4()),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "message_id": short_id(),
+            "timestamp": utc_timestamp(),
             "message_type": message_type.value,
             "source": {"type": source_type.value, "id": source_id},
             "payload": payload,
@@ -117,6 +123,23 @@ class MessageBus:
 
         return message
 
+    def _event_message(
+        self, source_type: str, source_id: str, action: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Untargeted EVENT message built directly (hot path for hook/skill events).
+
+        Same shape as create_message(MessageType.EVENT, ...) without target or
+        correlation_id; source_type is the SourceType value string.
+        """
+        return {
+            "message_id": short_id(),
+            "timestamp": utc_timestamp(),
+            "message_type": "event",
+            "source": {"type": source_type, "id": source_id},
+            "payload": {"action": action, "data": data},
+        }
+
     def publish(
         self, channel: str, message: Dict[str, Any], priority: str = "normal"
     ) -> bool:
@@ -135,43 +158,80 @@ class MessageBus:
             # Use memory-keeper context_save to publish to channel
             # Key format: {channel}:{message_id}
             key = f"{message['message_id']}"
-            value = json.dumps(message)
-
-            # Phase 4: Use memory-keeper bridge
-            priority_map = {"high": "high", "normal": "normal", "low": "low"}
-            bridge_script = Path(__file__).parent / "memory_keeper_bridge.py"
-
-            cmd = [
-                "python3",
-                str(bridge_script),
-                "publish",
-                "--channel", channel,
-                "--key", key,
-                "--value", value,
-                "--priority", priority_map.get(priority, "normal")
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
 
-            if result.returncode == 0:
+            # Phase 4: Use memory-keeper bridge (in-process, no interpreter spawn).
+            # The message dict is stored as-is and serialized once by the bridge.
+            if self._bridge.publish(
+                channel=channel,
+                key=key,
+                value=message,
+                priority=_PRIORITIES.get(priority, "normal"),
+                timestamp=message.get("timestamp"),
+            ):
                 print(
                     f"[MessageBus] Published to {channel}: {message['payload'].get('action', 'unknown')}",
                     file=sys.stderr,
                 )
                 return True
             else:
-                print(f"[MessageBus] Publish failed: {result.stderr}", file=sys.stderr)
+                print(f"[MessageBus] Publish failed: {channel}", file=sys.stderr)
                 return False
 
         except Exception as e:
             print(f"[MessageBus] Publish failed: {e}", file=sys.stderr)
             return False
 
+    def publish_many(self, entries: List[_Entry]) -> bool:
+        """
+        Publish several messages through the memory-keeper bridge.
+
+        Args:
+            entries: (channel, message, priority) tuples, published in order
+
+        Returns:
+            True if every message was published
+        """
+        if not entries:
+            return True
+
+        try:
+            # Group by channel (order kept within each channel): one write per channel
+            by_channel: Dict[str, List[Dict[str, Any]]] = {}
+            for channel, message, priority in entries:
+                by_channel.setdefault(channel, []).append({
+                    "key": message["message_id"],
+                    "value": message,
+                    "priority": _PRIORITIES.get(priority, "normal"),
+                })
+
+            for channel, channel_entries in by_channel.items():
+                if not self._bridge.publish_many(channel, channel_entries):
+                    print(f"[MessageBus] Batch publish failed: {channel}", file=sys.stderr)
+                    return False
+
+            print(f"[MessageBus] Published {len(entries)} messages", file=sys.stderr)
+            return True
+
+        except Exception as e:
+            print(f"[MessageBus] Batch publish failed: {e}", file=sys.stderr)
+            return False
+
+    def publish_batch(
+        self, channel: str, messages: List[Dict[str, Any]], priority: str = "normal"
+    ) -> bool:
+        """
+        Publish several messages to one channel in a single bridge write.
+
+        Args:
+            channel: Channel name
+            messages: Formatted message dicts
+            priority: Priority for every message (high/normal/low)
+
+        Returns:
+            True if every message was published
+        """
+        return self.publish_many([(channel, message, priority) for message in messages])
+
     def subscribe(
         self,
         channel: str,
@@ -187,42 +247,46 @@ class MessageBus:
             limit: Max messages to retrieve
 
         Returns:
-            List of messages from channel
+            List of stored records from channel; each record's "value" is the
+            message dict
         """
         try:
-            # Phase 4: Use memory-keeper bridge
-            bridge_script = Path(__file__).parent / "memory_keeper_bridge.py"
-
-            cmd = [
-                "python3",
-                str(bridge_script),
-                "subscribe",
-                "--channel", channel,
-                "--limit", str(limit)
-            ]
-
-            if message_filter:
-                cmd.extend(["--filter", json.dumps(message_filter)])
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=5,
+            # Phase 4: Use memory-keeper bridge (in-process)
+            messages = self._bridge.subscribe(
+                channel=channel, limit=limit, message_filter=message_filter
             )
 
-            if result.returncode == 0:
-                messages = json.loads(result.stdout.strip() or "[]")
-                print(f"[MessageBus] Retrieved {len(messages)} messages from {channel}", file=sys.stderr)
-                return messages
-            else:
-                print(f"[MessageBus] Subscribe failed: {result.stderr}", file=sys.stderr)
-                return []
+            # Records written before messages were stored as objects hold
+            # the message as a JSON string
+            for record in messages:
+                value = record.get("value")
+                if isinstance(value, str):
+                    try:
+                        record["value"] = json.loads(value)
+                    except ValueError:
+                        pass
+
+            print(f"[MessageBus] Retrieved {len(messages)} messages from {channel}", file=sys.stderr)
+            return messages
 
         except Exception as e:
             print(f"[MessageBus] Subscribe failed: {e}", file=sys.stderr)
             return []
 
+    def pipeline(self) -> "MessagePipeline":
+        """
+        Queue publishes and send them in one bridge round-trip.
+
+        Usage:
+            with bus.pipeline() as bp:
+                bp.publish_hook_event("pre_tool_use", event)
+                bp.publish_skill_event("council", event)
+
+        Returns:
+            MessagePipeline context manager (flushes on exit)
+        """
+        return MessagePipeline(self)
+
     def get_agent_channel(self, agent_id: str) -> str:
         """Get point-to-point channel name for agent"""
         return f"bus:agent:{agent_id}"
@@ -238,13 +302,16 @@ class MessageBus:
         Returns:
             True if broadcast succeeded
         """
+        return self.publish(*self._coordination_entry(announcement, sender_id))
+
+    def _coordination_entry(self, announcement: str, sender_id: str) -> _Entry:
         message = self.create_message(
             message_type=MessageType.BROADCAST,
             source_type=SourceType.SYSTEM,
             source_id=sender_id,
             payload={"action": "coordination_announcement", "data": {"announcement": announcement}},
         )
-        return self.publish(self.CHANNEL_COORDINATION, message, priority="high")
+        return self.CHANNEL_COORDINATION, message, "high"
 
     def publish_task_assignment(
         self, agent_id: str, task: Dict[str, Any], coordinator_id: str = "coordinator"
@@ -260,6 +327,11 @@ class MessageBus:
         Returns:
             True if published
         """
+        return self.publish_many(self._task_assignment_entries(agent_id, task, coordinator_id))
+
+    def _task_assignment_entries(
+        self, agent_id: str, task: Dict[str, Any], coordinator_id: str
+    ) -> List[_Entry]:
         message = self.create_message(
             message_type=MessageType.REQUEST,
             source_type=SourceType.AGENT,
@@ -270,10 +342,10 @@ class MessageBus:
         )
 
         # Publish to both task queue and agent's personal channel
-        queue_success = self.publish(self.CHANNEL_TASK_QUEUE, message)
-        agent_success = self.publish(self.get_agent_channel(agent_id), message)
-
-        return queue_success and agent_success
+        return [
+            (self.CHANNEL_TASK_QUEUE, message, "normal"),
+            (self.get_agent_channel(agent_id), message, "normal"),
+        ]
 
     def publish_task_result(
         self, task_id: str, result: Dict[str, Any], agent_id: str
@@ -289,6 +361,9 @@ class MessageBus:
         Returns:
             True if published
         """
+        return self.publish(*self._task_result_entry(task_id, result, agent_id))
+
+    def _task_result_entry(self, task_id: str, result: Dict[str, Any], agent_id: str) -> _Entry:
         message = self.create_message(
             message_type=MessageType.RESPONSE,
             source_type=SourceType.AGENT,
@@ -296,7 +371,7 @@ class MessageBus:
             payload={"action": "task_complete", "data": {"task_id": task_id, "result": result}},
             correlation_id=task_id,  # Correlate with original task
         )
-        return self.publish(self.CHANNEL_RESULTS, message, priority="high")
+        return self.CHANNEL_RESULTS, message, "high"
 
     def register_agent(self, agent_id: str, capabilities: List[str]) -> bool:
         """
@@ -309,16 +384,16 @@ class MessageBus:
         Returns:
             True if registered
         """
-        message = self.create_message(
-            message_type=MessageType.EVENT,
-            source_type=SourceType.AGENT,
-            source_id=agent_id,
-            payload={
-                "action": "agent_register",
-                "data": {"agent_id": agent_id, "capabilities": capabilities, "status": "active"},
-            },
+        return self.publish(*self._registration_entry(agent_id, capabilities))
+
+    def _registration_entry(self, agent_id: str, capabilities: List[str]) -> _Entry:
+        message = self._event_message(
+            "agent",
+            agent_id,
+            "agent_register",
+            {"agent_id": agent_id, "capabilities": capabilities, "status": "active"},
         )
-        return self.publish(self.CHANNEL_REGISTRY, message)
+        return self.CHANNEL_REGISTRY, message, "normal"
 
     def publish_hook_event(self, hook_name: str, event_data: Dict[str, Any]) -> bool:
         """
@@ -331,13 +406,11 @@ class MessageBus:
         Returns:
             True if published
         """
-        message = self.create_message(
-            message_type=MessageType.EVENT,
-            source_type=SourceType.HOOK,
-            source_id=hook_name,
-            payload={"action": "hook_event", "data": event_data},
-        )
-        return self.publish(self.CHANNEL_HOOKS, message)
+        return self.publish(*self._hook_event_entry(hook_name, event_data))
+
+    def _hook_event_entry(self, hook_name: str, event_data: Dict[str, Any]) -> _Entry:
+        message = self._event_message("hook", hook_name, "hook_event", event_data)
+        return self.CHANNEL_HOOKS, message, "normal"
 
     def publish_skill_event(self, skill_name: str, event_data: Dict[str, Any]) -> bool:
         """
@@ -350,22 +423,108 @@ class MessageBus:
         Returns:
             True if published
         """
-        message = self.create_message(
-            message_type=MessageType.EVENT,
-            source_type=SourceType.SKILL,
-            source_id=skill_name,
-            payload={"action": "skill_event", "data": event_data},
+        return self.publish(*self._skill_event_entry(skill_name, event_data))
+
+    def _skill_event_entry(self, skill_name: str, event_data: Dict[str, Any]) -> _Entry:
+        message = self._event_message("skill", skill_name, "skill_event", event_data)
+        return self.CHANNEL_SKILLS, message, "normal"
+
+
+class MessagePipeline:
+    """
+    Queues publishes for one batch instead of sending them.
+
+    Offers the bus's publish helpers (messages are built by the bus); queued
+    messages go out through a single publish_many() call when the context
+    exits (or on execute()). Reads go to the bus itself.
+    """
+
+    def __init__(self, bus: MessageBus):
+        """Initialize pipeline on top of an existing bus"""
+        self._bus = bus
+        self._queued: List[_Entry] = []
+        self.published = False
+
+    def publish(
+        self, channel: str, message: Dict[str, Any], priority: str = "normal"
+    ) -> bool:
+        """Queue message for the next execute() (always True)"""
+        self._queued.append((channel, message, priority))
+        return True
+
+    def publish_many(self, entries: List[_Entry]) -> bool:
+        """Queue messages for the next execute() (always True)"""
+        self._queued.extend(entries)
+        return True
+
+    def publish_batch(
+        self, channel: str, messages: List[Dict[str, Any]], priority: str = "normal"
+    ) -> bool:
+        """Queue messages for one channel (see MessageBus.publish_batch)"""
+        return self.publish_many([(channel, message, priority) for message in messages])
+
+    def broadcast_coordination(self, announcement: str, sender_id: str) -> bool:
+        """Queue a coordination announcement (see MessageBus.broadcast_coordination)"""
+        return self.publish(*self._bus._coordination_entry(announcement, sender_id))
+
+    def publish_task_assignment(
+        self, agent_id: str, task: Dict[str, Any], coordinator_id: str = "coordinator"
+    ) -> bool:
+        """Queue a task assignment (see MessageBus.publish_task_assignment)"""
+        return self.publish_many(
+            self._bus._task_assignment_entries(agent_id, task, coordinator_id)
         )
-        return self.publish(self.CHANNEL_SKILLS, message)
+
+    def publish_task_result(
+        self, task_id: str, result: Dict[str, Any], agent_id: str
+    ) -> bool:
+        """Queue a task result (see MessageBus.publish_task_result)"""
+        return self.publish(*self._bus._task_result_entry(task_id, result, agent_id))
+
+    def register_agent(self, agent_id: str, capabilities: List[str]) -> bool:
+        """Queue an agent registration (see MessageBus.register_agent)"""
+        return self.publish(*self._bus._registration_entry(agent_id, capabilities))
+
+    def publish_hook_event(self, hook_name: str, event_data: Dict[str, Any]) -> bool:
+        """Queue a hook event (see MessageBus.publish_hook_event)"""
+        return self.publish(*self._bus._hook_event_entry(hook_name, event_data))
+
+    def publish_skill_event(self, skill_name: str, event_data: Dict[str, Any]) -> bool:
+        """Queue a skill event (see MessageBus.publish_skill_event)"""
+        return self.publish(*self._bus._skill_event_entry(skill_name, event_data))
+
+    def execute(self) -> bool:
+        """
+        Send all queued messages in one batch.
+
+        Returns:
+            True if every queued message was published
+        """
+        entries, self._queued = self._queued, []
+        self.published = self._bus.publish_many(entries)
+        return self.published
+
+    def __enter__(self) -> "MessagePipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Flush even when the block raised: events queued so far still happened
+        self.execute()
+        return False
 
 
-# Singleton instance
+# Singleton instance (shared by all publishers in the process)
 _bus: Optional[MessageBus] = None
+_bus_lock = threading.Lock()
 
 
 def get_message_bus() -> MessageBus:
-    """Get singleton MessageBus instance (lazy initialization)"""
+    """Get singleton MessageBus instance (lazy, thread-safe initialization)"""
     global _bus
-    if _bus is None:
-        _bus = MessageBus()
-    return _bus
+    bus = _bus
+    if bus is None:
+        with _bus_lock:
+            bus = _bus
+            if bus is None:
+                bus = _bus = MessageBus()
+    return bus